@@ -0,0 +1,91 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Import-time benchmark and regression check for the package entry points.
+
+Each scenario runs in a fresh interpreter under ``python -X importtime``; the
+reported figure is the best import time over ``--repeat`` runs, counting only
+modules a bare interpreter does not already import. The check fails (exit
+status 1) when a scenario imports a module it should not, e.g. ``aiohttp``
+before the first async call, or exceeds ``--max-ms``::
+
+    python benchmarks/import_bench.py [--repeat N] [--max-ms MS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from typing import FrozenSet, List, NamedTuple, Optional, Set, Tuple
+
+
+class Scenario(NamedTuple):
+    label: str
+    statement: str
+    forbidden: FrozenSet[str]
+
+
+_SERVICES = frozenset({"vikingdb.vector", "vikingdb.memory", "vikingdb.knowledge"})
+
+_SCENARIOS = (
+    Scenario("import vikingdb", "import vikingdb", _SERVICES | {"aiohttp"}),
+    Scenario("vikingdb.VikingMem", "import vikingdb; vikingdb.VikingMem", _SERVICES - {"vikingdb.memory"} | {"aiohttp"}),
+    Scenario(
+        "vikingdb.VikingKnowledge",
+        "import vikingdb; vikingdb.VikingKnowledge",
+        _SERVICES - {"vikingdb.knowledge"} | {"aiohttp"},
+    ),
+    Scenario("vikingdb.VikingDB", "import vikingdb; vikingdb.VikingDB", _SERVICES - {"vikingdb.vector"} | {"aiohttp"}),
+)
+
+
+def _measure(statement: str, preloaded: FrozenSet[str] = frozenset()) -> Tuple[float, Set[str]]:
+    """Return import time in milliseconds, excluding ``preloaded``, and the imported modules."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    modules: Set[str] = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        module = name.strip()
+        modules.add(module)
+        # Only top-level entries count; nested ones are indented and included in them.
+        if not name[1:].startswith(" ") and module not in preloaded:
+            total_us += int(cumulative)
+    return total_us / 1000.0, modules
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="interpreter runs per scenario")
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if a scenario's import time exceeds this")
+    args = parser.parse_args(argv)
+
+    _, preloaded = _measure("pass")
+    failed = False
+    for scenario in _SCENARIOS:
+        runs = [_measure(scenario.statement, frozenset(preloaded)) for _ in range(args.repeat)]
+        elapsed = min(total for total, _ in runs)
+        leaked = sorted(scenario.forbidden & runs[0][1])
+        status = "ok"
+        if leaked:
+            status = "imports " + ", ".join(leaked)
+            failed = True
+        elif args.max_ms is not None and elapsed > args.max_ms:
+            status = f"over {args.max_ms:g} ms budget"
+            failed = True
+        print(f"{scenario.label:<28} {elapsed:9.1f} ms  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Micro-benchmark: per-call cost of building request bodies.
+
+Compares the previous ``model_dump``/dict-merge/``json.dumps`` pipeline with the
+fast paths in ``vikingdb._payload``. No network access is needed::
+
+    python benchmarks/payload_bench.py [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import timeit
+from typing import Any, Callable, Dict, Mapping
+
+from vikingdb._payload import EncodedPrefix, dump_model
+from vikingdb.knowledge.models.search import SearchCollectionRequest
+from vikingdb.vector.base import VectorClientBase
+from vikingdb.vector.models import SearchByVectorRequest
+
+_VECTOR_META = {"collection_name": "bench_collection", "index_name": "bench_index", "project_name": "default"}
+_KNOWLEDGE_META = {"collection_name": "bench_collection", "project": "default"}
+
+
+def _legacy_merge(base: Mapping[str, Any], request: Any) -> Dict[str, Any]:
+    if isinstance(request, SearchByVectorRequest):
+        body = request.model_dump(by_alias=True, exclude_none=True)
+    else:
+        body = {key: value for key, value in request.items() if value is not None}
+    merged = dict(base)
+    merged.update(body)
+    return merged
+
+
+def _vector_request(dim: int) -> Dict[str, Any]:
+    rng = random.Random(0)
+    return {
+        "dense_vector": [rng.random() for _ in range(dim)],
+        "limit": 10,
+        "filter": {"op": "must", "field": "tenant", "conds": ["t1", "t2"]},
+        "output_fields": ["title", "url"],
+        "partition": "p1",
+        "advance": {"dense_weight": 0.5},
+    }
+
+
+def _bench(label: str, fn: Callable[[], Any], number: int) -> float:
+    per_call = min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+    print(f"  {label:<34} {per_call:9.2f} us/call")
+    return per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="calls per timing run")
+    args = parser.parse_args()
+
+    for dim in (8, 768):
+        raw = _vector_request(dim)
+        model = SearchByVectorRequest(**raw)
+        print(f"vector search payload, dim={dim}")
+        before = _bench("model: model_dump + merge", lambda: _legacy_merge(_VECTOR_META, model), args.number)
+        after = _bench("model: fast path", lambda: VectorClientBase._merge_payload(_VECTOR_META, model), args.number)
+        print(f"  {'speedup':<34} {before / after:9.1f}x")
+        before = _bench("dict: filtered copy + merge", lambda: _legacy_merge(_VECTOR_META, raw), args.number)
+        after = _bench("dict: fast path", lambda: VectorClientBase._merge_payload(_VECTOR_META, raw), args.number)
+        print(f"  {'speedup':<34} {before / after:9.1f}x")
+
+    request = SearchCollectionRequest(query="what is a vector database", limit=10, dense_weight=0.5)
+    prefix = EncodedPrefix(_KNOWLEDGE_META)
+    print("knowledge search body (model -> JSON)")
+    before = _bench(
+        "model_dump + merge + dumps",
+        lambda: json.dumps({**_KNOWLEDGE_META, **request.model_dump(by_alias=True, exclude_none=True)}),
+        args.number,
+    )
+    after = _bench("dump_model + encoded meta", lambda: prefix.body(dump_model(request)), args.number)
+    print(f"  {'speedup':<34} {before / after:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import pytest
+
+from vikingdb.vector import EmbeddingCache, EmbeddingClient, VikingVectorException
+
+
+class _FakeService:
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.requests = []
+
+    def request(self, api, payload, *, options=None):
+        self.requests.append(payload)
+        return {"request_id": "r1", "result": {"data": [{"dense": vector} for vector in self.vectors]}}
+
+
+def _request(*texts):
+    return {"dense_model": {"name": "m"}, "data": [{"text": text} for text in texts]}
+
+
+def test_cached_embedding_aligns_hits_and_misses():
+    service = _FakeService([[1.0], [2.0]])
+    client = EmbeddingClient(service, cache=EmbeddingCache())
+    client.embedding(_request("a", "b"))
+    service.vectors = [[3.0]]
+    response = client.embedding(_request("b", "c", "a"))
+    assert [item.dense for item in response.result.data] == [[2.0], [3.0], [1.0]]
+    assert service.requests[-1]["data"] == [{"text": "c"}]
+
+
+def test_cached_embedding_rejects_short_response():
+    service = _FakeService([[1.0]])
+    client = EmbeddingClient(service, cache=EmbeddingCache())
+    with pytest.raises(VikingVectorException):
+        client.embedding(_request("a", "b"))
+    service.vectors = [[1.0], [2.0]]
+    client.embedding(_request("a", "b"))
+    assert service.requests[-1]["data"] == [{"text": "a"}, {"text": "b"}]
@@ -0,0 +1,45 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from vikingdb.vector import FederatedSearch
+from vikingdb.vector.models import SearchResponse
+
+
+class _FakeShard:
+    def __init__(self, hits):
+        self.hits = hits
+
+    def search_by_vector(self, request, *, request_options=None):
+        return SearchResponse.model_validate(
+            {"result": {"data": [{"id": id_, "score": score} for id_, score in self.hits]}}
+        )
+
+
+def test_federated_merge_keeps_shard_and_order():
+    search = FederatedSearch({"a": _FakeShard([(1, 0.9), (2, 0.5)]), "b": _FakeShard([(1, 0.8), (3, 0.7)])})
+    result = search.search_by_vector({"dense_vector": [1.0]}, limit=3)
+    assert [(hit.shard, hit.item.id) for hit in result.data] == [("a", 1), ("b", 1), ("b", 3)]
+    assert not result.partial
+
+
+def test_federated_merge_dedupe():
+    search = FederatedSearch({"a": _FakeShard([(1, 0.9), (2, 0.5)]), "b": _FakeShard([(1, 0.8), (3, 0.7)])})
+    result = search.search_by_vector({"dense_vector": [1.0], "limit": 10}, dedupe=True)
+    assert [(hit.shard, hit.item.id) for hit in result.data] == [("a", 1), ("b", 3), ("a", 2)]
+
+
+class _SharedResponseShard:
+    def __init__(self, response):
+        self.response = response
+
+    def search_by_vector(self, request, *, request_options=None):
+        return self.response
+
+
+def test_federated_attribution_with_shared_response_object():
+    shared = SearchResponse.model_validate({"result": {"data": [{"id": 1, "score": 0.9}, {"id": 2, "score": 0.5}]}})
+    search = FederatedSearch({"a": _SharedResponseShard(shared), "b": _SharedResponseShard(shared)})
+    result = search.search_by_vector({"dense_vector": [1.0]})
+    assert [(hit.shard, hit.item.id) for hit in result.data] == [("a", 1), ("b", 1), ("a", 2), ("b", 2)]
@@ -0,0 +1,60 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import vikingdb
+
+_IMPORT_BUDGET_MS = 150.0
+
+
+def _run(code: str) -> None:
+    subprocess.run([sys.executable, "-W", "ignore", "-c", code], check=True)
+
+
+def test_import_does_not_load_aiohttp_or_services():
+    _run(
+        "import sys, vikingdb\n"
+        "assert 'aiohttp' not in sys.modules\n"
+        "loaded = [name for name in ('vikingdb.vector', 'vikingdb.memory', 'vikingdb.knowledge') if name in sys.modules]\n"
+        "assert not loaded, loaded\n"
+    )
+
+
+def test_import_time_stays_within_budget():
+    # The eager package import took ~500 ms; the lazy one is a few ms. The budget is
+    # generous so that slow CI machines do not flake, yet catches eager imports.
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", "import vikingdb"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = {}
+    for line in completed.stderr.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                cumulative_us[name.strip()] = int(cumulative)
+    assert "aiohttp" not in cumulative_us
+    assert cumulative_us["vikingdb"] / 1000.0 < _IMPORT_BUDGET_MS, cumulative_us["vikingdb"]
+
+
+def test_sync_client_does_not_load_aiohttp():
+    _run("import sys, vikingdb; vikingdb.VikingDB; vikingdb.VikingMem; assert 'aiohttp' not in sys.modules")
+
+
+@pytest.mark.parametrize("name", vikingdb.__all__)
+def test_public_names_resolve(name):
+    assert getattr(vikingdb, name) is not None
+    assert name in dir(vikingdb)
+
+
+def test_unknown_name_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        vikingdb.not_a_name  # noqa: B018
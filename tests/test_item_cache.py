@@ -0,0 +1,63 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from vikingdb.vector import CollectionClient, ItemCache
+from vikingdb.vector.client import API_VECTOR_DATA_FETCH_IN_COLLECTION
+from vikingdb.vector.models import CollectionMeta
+
+
+class _FakeService:
+    """Answers fetches with rows tagged by the collection they were read from."""
+
+    def __init__(self):
+        self.fetches = []
+
+    def _bump_collection_generation(self, meta):
+        pass
+
+    def request(self, api, payload, *, options=None):
+        if api == API_VECTOR_DATA_FETCH_IN_COLLECTION:
+            self.fetches.append((payload["collection_name"], list(payload["ids"])))
+            items = [{"id": id, "fields": {"source": payload["collection_name"]}} for id in payload["ids"]]
+            return {"request_id": "r", "result": {"items": items, "ids_not_exist": []}}
+        return {"request_id": "r", "result": {}}
+
+
+def _collection(service, name, cache, project_name=None):
+    return CollectionClient(
+        service,
+        CollectionMeta(collection_name=name, project_name=project_name),
+        item_cache=cache,
+    )
+
+
+def test_shared_item_cache_is_scoped_by_collection():
+    service = _FakeService()
+    cache = ItemCache()
+    first = _collection(service, "a", cache)
+    second = _collection(service, "b", cache)
+    other_project = _collection(service, "a", cache, project_name="p")
+
+    assert first.fetch({"ids": [1]}).result.items[0].fields["source"] == "a"
+    assert second.fetch({"ids": [1]}).result.items[0].fields["source"] == "b"
+    assert other_project.fetch({"ids": [1]}).result.items[0].fields["source"] == "a"
+    assert len(service.fetches) == 3
+
+    assert first.fetch({"ids": [1]}).result.items[0].fields["source"] == "a"
+    assert len(service.fetches) == 3
+
+
+def test_write_invalidates_only_its_collection():
+    service = _FakeService()
+    cache = ItemCache()
+    first = _collection(service, "a", cache)
+    second = _collection(service, "b", cache)
+    first.fetch({"ids": [1]})
+    second.fetch({"ids": [1]})
+
+    first.upsert({"data": [{"id": 1}]})
+    first.fetch({"ids": [1]})
+    second.fetch({"ids": [1]})
+    assert service.fetches == [("a", [1]), ("b", [1]), ("a", [1])]
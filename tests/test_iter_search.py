@@ -0,0 +1,64 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+
+from vikingdb.vector import IndexClient
+from vikingdb.vector.models import IndexMeta
+
+
+class _PagingService:
+    """Serves an endless result set, one full page per request."""
+
+    def __init__(self):
+        self.requests = []
+
+    def _collection_generation(self, meta):
+        return 0
+
+    def request(self, api, payload, *, options=None):
+        self.requests.append(payload)
+        offset, limit = payload["offset"], payload["limit"]
+        data = [{"id": i, "score": 1.0 / (i + 1)} for i in range(offset, offset + limit)]
+        return {"request_id": f"r{len(self.requests)}", "result": {"data": data}}
+
+    async def async_request(self, api, payload, *, options=None, parse=None):
+        response = self.request(api, payload, options=options)
+        return parse(response) if parse is not None else response
+
+
+def _index(service):
+    return IndexClient(service, IndexMeta(collection_name="c", index_name="i"))
+
+
+def test_iter_search_stops_at_request_limit():
+    service = _PagingService()
+    hits = list(_index(service).iter_search("vector", {"dense_vector": [1.0], "limit": 5}, page_size=2))
+    assert [hit.id for hit in hits] == [0, 1, 2, 3, 4]
+    assert all(request["limit"] == 2 for request in service.requests)
+
+
+def test_iter_search_max_items_overrides_request_limit():
+    service = _PagingService()
+    hits = _index(service).iter_search(
+        "vector",
+        {"dense_vector": [1.0], "limit": 5, "offset": 10},
+        page_size=2,
+        max_items=3,
+        prefetch=False,
+    )
+    assert [hit.id for hit in hits] == [10, 11, 12]
+    assert [request["offset"] for request in service.requests] == [10, 12]
+
+
+def test_async_iter_search_stops_at_request_limit():
+    service = _PagingService()
+
+    async def collect():
+        index = _index(service)
+        return [hit async for hit in index.async_iter_search("vector", {"dense_vector": [1.0], "limit": 3}, page_size=2)]
+
+    hits = asyncio.run(collect())
+    assert [hit.id for hit in hits] == [0, 1, 2]
@@ -0,0 +1,185 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+
+import pytest
+import requests
+
+from vikingdb._jsonstream import JSONArrayStream
+from vikingdb.auth import APIKey
+from vikingdb.exceptions import VikingAPIException
+from vikingdb.vector import VikingDB, VikingVectorException
+from vikingdb.vector.client import API_VECTOR_DATA_FETCH_IN_COLLECTION
+
+_PATH = ("result", "fetch")
+_ROWS = [
+    {"id": 1, "fields": {"text": 'tricky ] " { , } [ : \\ text'}},
+    {"id": "é漢😀", "fields": {"nested": [[1, 2], {"a": "]"}], "empty": []}},
+    123,
+    -4.5e-3,
+    "plain ] string",
+    None,
+    True,
+    [],
+    {},
+]
+_DOCUMENT = {
+    "code": "Success",
+    "request_id": "req-1",
+    "result": {"before": [{"fetch": [0]}], "fetch": _ROWS, "ids_not_exist": ["x"]},
+}
+_ENVELOPE = {
+    "code": "Success",
+    "request_id": "req-1",
+    "result": {"before": [{"fetch": [0]}], "fetch": [], "ids_not_exist": ["x"]},
+}
+
+
+def _encode(document) -> bytes:
+    return json.dumps(document, ensure_ascii=False).encode("utf-8")
+
+
+def _parse(chunks, path=_PATH):
+    stream = JSONArrayStream(path)
+    items = []
+    for chunk in chunks:
+        items.extend(stream.feed(chunk))
+    items.extend(stream.close())
+    return items, stream.envelope()
+
+
+def test_split_at_every_byte_boundary():
+    raw = _encode(_DOCUMENT)
+    for split in range(len(raw) + 1):
+        items, envelope = _parse([raw[:split], raw[split:]])
+        assert items == _ROWS, split
+        assert envelope == _ENVELOPE, split
+
+
+def test_byte_by_byte_feed_with_multibyte_utf8():
+    raw = _encode(_DOCUMENT)
+    assert len(raw) > len(json.dumps(_DOCUMENT, ensure_ascii=False))  # multibyte characters present
+    items, envelope = _parse([raw[i:i + 1] for i in range(len(raw))])
+    assert items == _ROWS
+    assert envelope == _ENVELOPE
+
+
+def test_scalar_split_mid_number():
+    stream = JSONArrayStream(("a",))
+    assert stream.feed(b'{"a": [12') == []
+    assert stream.feed(b"3, 4") == [123]
+    assert stream.feed(b"5]}") == [45]
+    assert stream.close() == []
+    assert stream.envelope() == {"a": []}
+
+
+@pytest.mark.parametrize("head, tail, expected", [(b"[-0.", b"0045]", -0.0045), (b"[1e", b"3]", 1000.0), (b"[7", b"]", 7)])
+def test_number_prefix_is_not_taken_as_element(head, tail, expected):
+    stream = JSONArrayStream(("a",))
+    assert stream.feed(b'{"a": ' + head) == []
+    assert stream.feed(tail + b"}") == [expected]
+
+
+def test_missing_path_yields_nothing_and_keeps_envelope():
+    document = {"code": "Success", "result": {"data": [1, 2], "fetch": "not an array"}}
+    items, envelope = _parse([_encode(document)])
+    assert items == []
+    assert envelope == document
+
+
+def test_truncated_document_raises_value_error():
+    raw = _encode(_DOCUMENT)
+    stream = JSONArrayStream(_PATH)
+    stream.feed(raw[: len(raw) // 2])
+    with pytest.raises(ValueError):
+        stream.close()
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes, status_code: int = 200, chunk: int = 7):
+        self.body = body
+        self.status_code = status_code
+        self.chunk = chunk
+
+    @property
+    def content(self) -> bytes:
+        return self.body
+
+    def iter_content(self, chunk_size=None):
+        for start in range(0, len(self.body), self.chunk):
+            yield self.body[start:start + self.chunk]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def fake_http(monkeypatch):
+    posts = []
+    state = {"body": b""}
+
+    def post(session, url, **kwargs):
+        posts.append((url, kwargs))
+        assert kwargs.get("stream") is True
+        return _FakeResponse(state["body"])
+
+    monkeypatch.setattr(requests.Session, "get", lambda session, url, **kwargs: _FakeResponse(b""))
+    monkeypatch.setattr(requests.Session, "post", post)
+    return posts, state
+
+
+def _client() -> VikingDB:
+    return VikingDB(host="vikingdb.test", region="r", auth=APIKey(api_key="k"), scheme="http")
+
+
+def test_stream_fetch_end_to_end(fake_http):
+    posts, state = fake_http
+    rows = [{"id": i, "fields": {"title": f"t{i} ]"}} for i in range(50)]
+    state["body"] = _encode({"code": "Success", "result": {"fetch": rows, "ids_not_exist": []}})
+    collection = _client().collection(collection_name="c")
+    items = list(collection.stream_fetch({"ids": list(range(50))}))
+    assert [item.id for item in items] == list(range(50))
+    assert items[3].fields == {"title": "t3 ]"}
+    url, kwargs = posts[0]
+    assert "/api/vikingdb/data/fetch_in_collection" in url
+    assert json.loads(kwargs["data"])["collection_name"] == "c"
+
+
+def test_request_items_returns_envelope(fake_http):
+    _, state = fake_http
+    state["body"] = _encode(_DOCUMENT)
+    stream = _client().request_items(API_VECTOR_DATA_FETCH_IN_COLLECTION, {"ids": [1]}, _PATH)
+    items = []
+    with pytest.raises(StopIteration) as stop:
+        while True:
+            items.append(next(stream))
+    assert items == _ROWS
+    assert stop.value.value == _ENVELOPE
+
+
+def test_truncated_stream_surfaces_api_exception(fake_http):
+    _, state = fake_http
+    raw = _encode({"result": {"fetch": [{"id": i} for i in range(5)]}})
+    state["body"] = raw[: len(raw) - 10]
+    client = _client()
+    with pytest.raises(VikingAPIException):
+        list(client._stream_json_array(API_VECTOR_DATA_FETCH_IN_COLLECTION, None, "{}", _PATH))
+    with pytest.raises(VikingVectorException):
+        list(client.collection(collection_name="c").stream_fetch({"ids": [1]}))
+
+
+def test_index_stream_search_and_fetch(fake_http):
+    posts, state = fake_http
+    index = _client().index(collection_name="c", index_name="i")
+    state["body"] = _encode({"result": {"data": [{"id": 1, "score": 0.9}, {"id": 2, "score": 0.4}], "total_return_count": 2}})
+    hits = list(index.stream_search("vector", {"dense_vector": [1.0], "limit": 2}))
+    assert [(hit.id, hit.score) for hit in hits] == [(1, 0.9), (2, 0.4)]
+    assert "/api/vikingdb/data/search/vector" in posts[-1][0]
+    state["body"] = _encode({"result": {"fetch": [{"id": 7, "fields": {}}], "ids_not_exist": []}})
+    assert [item.id for item in index.stream_fetch({"ids": [7]})] == [7]
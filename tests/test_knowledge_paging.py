@@ -0,0 +1,50 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+from vikingdb.knowledge import CollectionMeta, KnowledgeCollection
+
+
+class _PointsClient:
+    """Serves ``total`` points, reporting ``total_num`` at the top level like ListPoints."""
+
+    def __init__(self, total):
+        self.total = total
+        self.offsets = []
+
+    def json_exception(self, api, params, body, headers=None, timeout=None):
+        payload = json.loads(body)
+        offset, limit = payload.get("offset", 0), payload["limit"]
+        self.offsets.append(offset)
+        points = [{"point_id": str(i)} for i in range(offset, min(offset + limit, self.total))]
+        return {"code": 0, "data": {"point_list": points}, "total_num": self.total}
+
+    async def async_json_exception(self, api, params, body, headers=None, timeout=None):
+        return self.json_exception(api, params, body, headers=headers, timeout=timeout)
+
+
+def _collection(client):
+    return KnowledgeCollection(client, CollectionMeta(collection_name="c"))
+
+
+def test_iter_points_stops_at_total_num():
+    client = _PointsClient(total=4)
+    points = list(_collection(client).iter_points(page_size=2, prefetch=False))
+    assert [point.point_id for point in points] == ["0", "1", "2", "3"]
+    # A full last page would otherwise trigger one more, empty, request.
+    assert client.offsets == [0, 2]
+
+
+def test_async_iter_points_stops_at_total_num():
+    client = _PointsClient(total=4)
+
+    async def collect():
+        return [point async for point in _collection(client).async_iter_points(page_size=2, raw=True)]
+
+    points = asyncio.run(collect())
+    assert [point["point_id"] for point in points] == ["0", "1", "2", "3"]
+    assert client.offsets == [0, 2]
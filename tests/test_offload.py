@@ -0,0 +1,153 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+import pytest
+import requests
+from pydantic import ValidationError
+
+from vikingdb import DecodeOffload, LoopLagMonitor, VikingKnowledge, VikingMem
+from vikingdb.auth import APIKey
+from vikingdb.exceptions import VikingAPIException
+from vikingdb.vector import VikingDB
+from vikingdb.vector.client import API_VECTOR_DATA_FETCH_IN_INDEX
+from vikingdb.vector.models import FetchDataInIndexResponse
+
+
+class _RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.calls = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.calls.append(getattr(fn, "func", fn))
+        return super().submit(fn, *args, **kwargs)
+
+
+def test_threshold_chooses_offload_or_inline():
+    async def scenario(offload):
+        small = await offload.decode(b'{"a": 1}')
+        large = await offload.decode(json.dumps({"rows": list(range(100))}).encode())
+        return small, large
+
+    executor = _RecordingExecutor()
+    offload = DecodeOffload(threshold_bytes=64, executor=executor)
+    small, large = asyncio.run(scenario(offload))
+    executor.shutdown()
+    assert small == {"a": 1}
+    assert large == {"rows": list(range(100))}
+    assert offload.stats.inline == 1
+    assert offload.stats.offloaded == 1
+    assert offload.stats.offloaded_bytes > 64
+    assert len(executor.calls) == 1
+
+
+def test_negative_threshold_rejected():
+    with pytest.raises(ValueError):
+        DecodeOffload(threshold_bytes=-1)
+
+
+class _FakeAiohttpResponse:
+    def __init__(self, body: bytes, status: int = 200):
+        self.body = body
+        self.status = status
+        self.headers = {"X-Tt-Logid": "log-1"}
+
+    async def read(self) -> bytes:
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def fake_transport(monkeypatch):
+    state = {"body": b"{}", "error": None, "calls": 0}
+
+    def request(method, url, **kwargs):
+        state["calls"] += 1
+        if state["error"] is not None:
+            raise state["error"]
+        return _FakeAiohttpResponse(state["body"])
+
+    monkeypatch.setattr(requests.Session, "get", lambda session, url, **kwargs: type("R", (), {"status_code": 200})())
+    monkeypatch.setattr(aiohttp, "request", request)
+    return state
+
+
+def _client(offload=None) -> VikingDB:
+    return VikingDB(host="vikingdb.test", region="r", auth=APIKey(api_key="k"), scheme="http", decode_offload=offload)
+
+
+def test_validation_runs_in_executor(fake_transport):
+    fake_transport["body"] = json.dumps({"result": {"fetch": [{"id": 1, "fields": {}}]}}).encode()
+    executor = _RecordingExecutor()
+    offload = DecodeOffload(threshold_bytes=0, executor=executor)
+    index = _client(offload).index(collection_name="c", index_name="i")
+    response = asyncio.run(index.async_fetch({"ids": [1]}))
+    executor.shutdown()
+    assert isinstance(response, FetchDataInIndexResponse)
+    assert [item.id for item in response.result.items] == [1]
+    assert FetchDataInIndexResponse.model_validate in executor.calls
+    assert offload.stats.offloaded == 2  # decode + validation
+
+
+def test_validation_error_reaches_caller_without_retry(fake_transport):
+    fake_transport["body"] = json.dumps({"result": {"fetch": "not a list"}}).encode()
+    index = _client(DecodeOffload(threshold_bytes=0)).index(collection_name="c", index_name="i")
+    with pytest.raises(ValidationError):
+        asyncio.run(index.async_fetch({"ids": [1]}))
+    assert fake_transport["calls"] == 1
+
+
+def test_connection_error_raises_api_exception(fake_transport):
+    fake_transport["error"] = aiohttp.ClientConnectionError("refused")
+    client = _client()
+    with pytest.raises(VikingAPIException) as info:
+        asyncio.run(client.async_json(API_VECTOR_DATA_FETCH_IN_INDEX, None, "{}"))
+    assert "refused" in str(info.value)
+
+
+def test_loop_lag_monitor_records_and_stops():
+    async def scenario():
+        monitor = LoopLagMonitor(interval=0.001)
+        async with monitor:
+            running = monitor._task
+            await asyncio.sleep(0.02)
+        assert running is not None and running.cancelled()
+        task_after_exit = monitor._task
+        samples = monitor.stats.samples
+        monitor.start()
+        await asyncio.sleep(0.005)
+        await monitor.stop()
+        await monitor.stop()  # stopping twice is harmless
+        return task_after_exit, samples, monitor
+
+    task_after_exit, samples, monitor = asyncio.run(scenario())
+    assert task_after_exit is None
+    assert samples > 0
+    assert monitor.stats.samples >= samples
+    assert monitor.stats.max_lag >= monitor.stats.mean_lag >= 0.0
+    monitor.reset()
+    assert monitor.stats.samples == 0
+
+
+def test_loop_lag_monitor_rejects_bad_interval():
+    with pytest.raises(ValueError):
+        LoopLagMonitor(interval=0)
+
+
+@pytest.mark.parametrize("client_cls", [VikingKnowledge, VikingMem])
+def test_other_clients_accept_decode_offload(client_cls):
+    offload = DecodeOffload()
+    client = client_cls(auth=APIKey(api_key="k"), decode_offload=offload)
+    assert client.decode_offload is offload
@@ -0,0 +1,39 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import pytest
+
+from vikingdb.vector import IndexClient, SemanticQueryCache
+from vikingdb.vector.models import IndexMeta
+
+pytest.importorskip("numpy")
+
+
+class _FakeService:
+    def __init__(self):
+        self.requests = []
+
+    def _collection_generation(self, meta):
+        return 0
+
+    def request(self, api, payload, *, options=None):
+        self.requests.append(payload)
+        return {"request_id": f"r{len(self.requests)}", "result": {"data": [{"id": len(self.requests), "score": 1.0}]}}
+
+
+def test_search_by_vector_many_uses_semantic_cache():
+    service = _FakeService()
+    index = IndexClient(
+        service,
+        IndexMeta(collection_name="c", index_name="i"),
+        semantic_cache=SemanticQueryCache(threshold=0.99),
+    )
+    first = index.search_by_vector({"dense_vector": [1.0, 0.0], "limit": 3})
+    results = index.search_by_vector_many([[1.0, 0.001], [0.0, 1.0]], template={"limit": 3})
+    assert len(service.requests) == 2
+    assert results[0] is first
+    assert results[1].result.data[0].id == 2
+    assert index.search_by_vector({"dense_vector": [0.0, 1.0], "limit": 3}) is results[1]
+    assert len(service.requests) == 2
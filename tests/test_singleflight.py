@@ -0,0 +1,139 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from vikingdb._client import Client
+from vikingdb._singleflight import SingleFlight
+
+
+def test_async_leader_cancellation_keeps_followers_result():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def scenario():
+        flight = SingleFlight()
+        leader = asyncio.ensure_future(asyncio.wait_for(flight.async_do("key", fetch), timeout=0.01))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(flight.async_do("key", fetch)) for _ in range(2)]
+        with pytest.raises(asyncio.TimeoutError):
+            await leader
+        return await asyncio.gather(*followers)
+
+    assert asyncio.run(scenario()) == ["result", "result"]
+    assert len(calls) == 1
+
+
+def test_async_call_cancelled_when_every_caller_gives_up():
+    started = []
+    cancelled = []
+
+    async def fetch():
+        started.append(1)
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+        return "stale"
+
+    async def fresh():
+        return "fresh"
+
+    async def scenario():
+        flight = SingleFlight()
+        waiters = [asyncio.ensure_future(flight.async_do("key", fetch)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        result = await flight.async_do("key", fresh)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(scenario()) == "fresh"
+    assert started == [1]
+    assert cancelled == [1]
+
+
+def test_async_error_is_shared():
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def scenario():
+        flight = SingleFlight()
+        return await asyncio.gather(
+            *(flight.async_do("key", fail) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    errors = asyncio.run(scenario())
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert errors[0] is errors[1] is errors[2]
+
+
+class _CountingClient(Client):
+    _idempotent_apis = frozenset({"Search"})
+
+    def __init__(self):  # skip network/auth setup
+        self._singleflight = SingleFlight()
+        self.sent = []
+        self._release = threading.Event()
+
+    def _build_api_info(self):
+        return {}
+
+    def _send_json(self, api, params, body, headers=None, timeout=None):
+        self.sent.append(dict(headers or {}))
+        self._release.wait(1)
+        return {"tenant": (headers or {}).get("X-Tenant")}
+
+
+def _concurrent_json(client, calls):
+    results = [None] * len(calls)
+
+    def run(index, headers, timeout):
+        results[index] = client._json("Search", None, '{"q": 1}', headers=headers, timeout=timeout)
+
+    threads = [threading.Thread(target=run, args=(index, *call)) for index, call in enumerate(calls)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    client._release.set()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_calls_with_different_headers_are_not_merged():
+    client = _CountingClient()
+    results = _concurrent_json(client, [({"X-Tenant": "a"}, None), ({"X-Tenant": "b"}, None)])
+    assert len(client.sent) == 2
+    assert results == [{"tenant": "a"}, {"tenant": "b"}]
+
+
+def test_calls_with_different_timeouts_are_not_merged():
+    client = _CountingClient()
+    _concurrent_json(client, [({"X-Tenant": "a"}, 5), ({"X-Tenant": "a"}, 10)])
+    assert len(client.sent) == 2
+
+
+def test_calls_differing_only_in_log_id_are_merged():
+    client = _CountingClient()
+    results = _concurrent_json(
+        client,
+        [({"X-Tenant": "a", "X-Tt-Logid": "1"}, None), ({"x-tenant": "a", "X-Tt-Logid": "2"}, None)],
+    )
+    assert len(client.sent) == 1
+    assert results[0] is results[1]
@@ -0,0 +1,59 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from vikingdb.vector import IndexClient
+from vikingdb.vector.base import sum_token_usage
+from vikingdb.vector.models import IndexMeta
+
+
+class _FakeService:
+    def __init__(self):
+        self.requests = []
+
+    def request(self, api, payload, *, options=None):
+        self.requests.append((api, payload))
+        hit = len(self.requests)
+        return {
+            "request_id": f"r{hit}",
+            "result": {
+                "data": [{"id": hit, "score": 1.0 / hit}],
+                "token_usage": {"total_tokens": 10, "model": {"prompt_tokens": 4}},
+            },
+        }
+
+
+def _index(service):
+    return IndexClient(service, IndexMeta(collection_name="c", index_name="i"))
+
+
+def test_sum_token_usage():
+    total = sum_token_usage(
+        [
+            {"total_tokens": 3, "model": {"prompt_tokens": 1}, "unit": "token"},
+            None,
+            {"total_tokens": 4, "model": {"prompt_tokens": 2}, "unit": "token"},
+        ]
+    )
+    assert total == {"total_tokens": 7, "model": {"prompt_tokens": 3}, "unit": "token"}
+
+
+def test_partition_scatter_sums_token_usage():
+    service = _FakeService()
+    response = _index(service).search_by_vector(
+        {"dense_vector": [1.0], "limit": 5},
+        partitions=["p1", "p2", "p3"],
+    )
+    assert len(service.requests) == 3
+    assert response.result.token_usage == {"total_tokens": 30, "model": {"prompt_tokens": 12}}
+
+
+def test_hybrid_search_sums_token_usage():
+    service = _FakeService()
+    response = _index(service).search_hybrid(
+        vector={"dense_vector": [1.0], "limit": 5},
+        keywords={"keywords": ["q"], "limit": 5},
+    )
+    assert len(service.requests) == 2
+    assert response.result.token_usage == {"total_tokens": 20, "model": {"prompt_tokens": 8}}
@@ -3,28 +3,48 @@
 
 from __future__ import annotations
 
-from .auth import APIKey, IAM
-from .request_options import RequestOptions
-from . import vector
-from . import memory
-from .vector import (
-    CollectionClient,
-    EmbeddingClient,
-    IndexClient,
-    RerankClient,
-    VikingDB,
-    VikingVector,
-)
-from .memory import (
-    VikingMem,
-    Collection,
-)
-from .knowledge import (
-    VikingKnowledge,
-    KnowledgeCollection,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
 
 from .version import __version__
+
+if TYPE_CHECKING:
+    from . import knowledge, memory, vector
+    from .auth import APIKey, IAM
+    from .knowledge import KnowledgeCollection, VikingKnowledge
+    from .memory import Collection, VikingMem
+    from .offload import DecodeOffload, LoopLagMonitor
+    from .request_options import RequestOptions
+    from .vector import (
+        CollectionClient,
+        EmbeddingClient,
+        IndexClient,
+        RerankClient,
+        VikingDB,
+        VikingVector,
+    )
+
+# Public names are resolved on first access so that a process using one service
+# does not pay for importing the others (or aiohttp, pydantic models, ...).
+_LAZY_ATTRS: Dict[str, str] = {
+    "IAM": ".auth",
+    "APIKey": ".auth",
+    "DecodeOffload": ".offload",
+    "LoopLagMonitor": ".offload",
+    "RequestOptions": ".request_options",
+    "CollectionClient": ".vector",
+    "EmbeddingClient": ".vector",
+    "IndexClient": ".vector",
+    "RerankClient": ".vector",
+    "VikingDB": ".vector",
+    "VikingVector": ".vector",
+    "VikingMem": ".memory",
+    "Collection": ".memory",
+    "VikingKnowledge": ".knowledge",
+    "KnowledgeCollection": ".knowledge",
+}
+_LAZY_SUBMODULES = frozenset({"vector", "memory", "knowledge"})
+
 __all__ = [
     "IAM",
     "APIKey",
@@ -32,14 +52,32 @@ __all__ = [
     "EmbeddingClient",
     "RerankClient",
     "IndexClient",
+    "DecodeOffload",
+    "LoopLagMonitor",
     "RequestOptions",
     "VikingDB",
     "VikingVector",
     "vector",
     "memory",
+    "knowledge",
     "VikingMem",
     "Collection",
     "VikingKnowledge",
     "KnowledgeCollection",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -5,12 +5,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 from abc import ABC, abstractmethod
 from json import JSONDecodeError
-from typing import Any, Mapping, Optional
-
-import aiohttp
+from typing import Any, Callable, FrozenSet, Generator, List, Mapping, Optional, Sequence, Tuple
 
 from volcengine.ApiInfo import ApiInfo
 from volcengine.ServiceInfo import ServiceInfo
@@ -18,19 +17,57 @@ from volcengine.base.Request import Request
 from volcengine.base.Service import Service
 import requests
 
+from ._jsonstream import JSONArrayStream
+from ._singleflight import SingleFlight
 from .auth import Auth, IAM, APIKey, HeaderAuth
 from .exceptions import (
     DEFAULT_UNKNOWN_ERROR_CODE,
     VikingAPIException,
 )
+from .offload import DecodeOffload
 
 
 _REQUEST_ID_HEADER = "X-Tt-Logid"
+_STREAM_READ_BYTES = 64 * 1024
+
+
+def _flight_key(
+    api: str,
+    params: Optional[Mapping[str, Any]],
+    body: Any,
+    headers: Optional[Mapping[str, str]] = None,
+    timeout: Optional[int] = None,
+) -> Tuple[str, str, str, str, Optional[int]]:
+    """Identify a request by API, query, caller headers, timeout and a key-order independent body digest.
+
+    Headers take part because they may scope the response (tenant, account, auth);
+    only the log id is left out, as it is unique to every request.
+    """
+    try:
+        canonical = json.dumps(json.loads(body), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    except (TypeError, ValueError):
+        canonical = body if isinstance(body, str) else repr(body)
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    query = json.dumps(dict(params), sort_keys=True, default=str) if params else ""
+    scoped_headers = ""
+    if headers:
+        scoped_headers = json.dumps(
+            sorted(
+                (name.lower(), str(value))
+                for name, value in headers.items()
+                if name.lower() != _REQUEST_ID_HEADER.lower()
+            )
+        )
+    return api, query, scoped_headers, digest, timeout
 
 
 class Client(Service, ABC):
     """Reusable base client built on top of volcengine Service."""
 
+    #: Read-only APIs whose concurrent identical calls may share one request when
+    #: ``singleflight`` is enabled. Subclasses list their own idempotent APIs.
+    _idempotent_apis: FrozenSet[str] = frozenset()
+
     def __init__(
         self,
         *,
@@ -41,7 +78,11 @@ class Client(Service, ABC):
         sts_token: str = "",
         scheme: str = "http",
         timeout: int = 30,
+        singleflight: bool = False,
+        decode_offload: Optional[DecodeOffload] = None,
     ):
+        self._singleflight = SingleFlight() if singleflight else None
+        self.decode_offload = decode_offload
         self.region = region
         self.service = service
         self.auth_provider = auth
@@ -116,6 +157,21 @@ class Client(Service, ABC):
             headers: Additional headers
             timeout: Timeout in seconds (optional). If not provided, uses default connection_timeout and socket_timeout.
         """
+        if self._singleflight is not None and api in self._idempotent_apis:
+            return self._singleflight.do(
+                _flight_key(api, params, body, headers, timeout),
+                lambda: self._send_json(api, params, body, headers=headers, timeout=timeout),
+            )
+        return self._send_json(api, params, body, headers=headers, timeout=timeout)
+
+    def _send_json(
+        self,
+        api: str,
+        params: Optional[Mapping[str, Any]],
+        body: Any,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[int] = None,
+    ) -> Any:
         if api not in self.api_info:
             raise Exception("no such api")
         api_info = self.api_info[api]
@@ -144,7 +200,7 @@ class Client(Service, ABC):
             response = self.session.post(
                 url,
                 headers=request.headers,
-                data=request.body.encode("utf-8"),
+                data=request.body.encode("utf-8") if isinstance(request.body, str) else request.body,
                 timeout=request_timeout,
             )
         except Exception as exc:
@@ -189,6 +245,7 @@ class Client(Service, ABC):
         body: Any,
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
+        parse: Optional[Callable[[Any], Any]] = None,
     ) -> Any:
         """Send a JSON request asynchronously.
         
@@ -198,7 +255,25 @@ class Client(Service, ABC):
             body: Request body
             headers: Additional headers
             timeout: Timeout in seconds (optional). If not provided, uses default connection_timeout and socket_timeout.
+            parse: Optional conversion (e.g. ``Model.model_validate``) applied to a non-empty
+                decoded response; with ``decode_offload`` it runs in the executor for large bodies.
         """
+        if self._singleflight is not None and api in self._idempotent_apis:
+            return await self._singleflight.async_do(
+                _flight_key(api, params, body, headers, timeout) + (parse,),
+                lambda: self._async_send_json(api, params, body, headers=headers, timeout=timeout, parse=parse),
+            )
+        return await self._async_send_json(api, params, body, headers=headers, timeout=timeout, parse=parse)
+
+    async def _async_send_json(
+        self,
+        api: str,
+        params: Optional[Mapping[str, Any]],
+        body: Any,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[int] = None,
+        parse: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
         if api not in self.api_info:
             raise Exception("no such api")
         api_info = self.api_info[api]
@@ -210,6 +285,10 @@ class Client(Service, ABC):
         request.body = body
 
         self.auth_provider.sign_request(request)
+
+        # Imported on first use: aiohttp is the most expensive import of the SDK and
+        # synchronous-only processes never need it.
+        import aiohttp
         
         # Use custom timeout if provided, otherwise use default
         if timeout is not None:
@@ -225,6 +304,8 @@ class Client(Service, ABC):
             )
         
         url = request.build()
+        offload = self.decode_offload
+        request_id = "unknown"
         try:
             async with aiohttp.request(
                 "POST",
@@ -235,16 +316,16 @@ class Client(Service, ABC):
             ) as response:
                 request_id_value = response.headers.get(_REQUEST_ID_HEADER)
                 request_id = str(request_id_value) if request_id_value else "unknown"
-                payload = await response.text(encoding="utf-8")
+                raw = await response.read()
                 if response.status != 200:
                     error = VikingAPIException.from_response(
-                        payload,
+                        raw.decode("utf-8", errors="replace"),
                         request_id=request_id,
                         status_code=response.status,
                     )
                     raise error
                 try:
-                    return json.loads(payload)
+                    data = await offload.decode(raw) if offload is not None else json.loads(raw)
                 except JSONDecodeError as exc:
                     raise VikingAPIException(
                         DEFAULT_UNKNOWN_ERROR_CODE,
@@ -258,6 +339,11 @@ class Client(Service, ABC):
                     request_id=request_id,
                     message=f"failed to run aiohttp {api}: {exc}",
                 ) from exc
+        if parse is None or not data:
+            return data
+        if offload is not None and offload.validate:
+            return await offload.run(parse, data, size=len(raw))
+        return parse(data)
 
 
     def _stream_json(self, api, params, body, headers=None, timeout=None):
@@ -309,3 +395,75 @@ class Client(Service, ABC):
                         break
                 except Exception:
                     pass
+
+    def _stream_json_array(
+        self,
+        api: str,
+        params: Optional[Mapping[str, Any]],
+        body: Any,
+        path: Sequence[str],
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[int] = None,
+    ) -> Generator[Any, None, Any]:
+        """Send a JSON request and yield the elements of the response array at ``path``.
+
+        The response is read in chunks and each element is decoded as soon as it is
+        complete. The rest of the document (with the array emptied) is the
+        generator's return value.
+        """
+        if api not in self.api_info:
+            raise Exception("no such api")
+        api_info = self.api_info[api]
+        request = self.prepare_request(api_info, params)
+        if headers:
+            for key, value in headers.items():
+                request.headers[key] = value
+        request.headers["Content-Type"] = "application/json"
+        request.body = body
+        self.auth_provider.sign_request(request)
+        url = request.build()
+        request_id_value = request.headers.get(_REQUEST_ID_HEADER)
+        request_id = str(request_id_value) if request_id_value else "unknown"
+        if timeout is not None:
+            request_timeout = (timeout, timeout)
+        else:
+            request_timeout = (
+                self.service_info.connection_timeout,
+                self.service_info.socket_timeout,
+            )
+        try:
+            response = self.session.post(
+                url,
+                headers=request.headers,
+                data=request.body.encode("utf-8") if isinstance(request.body, str) else request.body,
+                stream=True,
+                timeout=request_timeout,
+            )
+        except Exception as exc:
+            raise VikingAPIException(
+                    DEFAULT_UNKNOWN_ERROR_CODE,
+                    request_id=request_id,
+                    message=f"failed to run session.post {api}: {exc}",
+                ) from exc
+        with response:
+            if response.status_code != 200:
+                payload_text = response.content.decode("utf-8", errors="replace") if response.content else ""
+                raise VikingAPIException.from_response(
+                    payload_text,
+                    request_id=request_id,
+                    status_code=response.status_code,
+                )
+            parser = JSONArrayStream(path)
+            try:
+                for chunk in response.iter_content(chunk_size=_STREAM_READ_BYTES):
+                    items: List[Any] = parser.feed(chunk)
+                    yield from items
+                yield from parser.close()
+                return parser.envelope()
+            except ValueError as exc:
+                raise VikingAPIException(
+                    DEFAULT_UNKNOWN_ERROR_CODE,
+                    request_id=request_id,
+                    message=f"failed to decode JSON response for {api}: {exc}",
+                    status_code=response.status_code,
+                ) from exc
@@ -0,0 +1,58 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Bounded fan-out helpers shared by the service clients."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Sequence, TypeVar, Union
+
+T = TypeVar("T")
+
+
+def run_concurrently(
+    calls: Sequence[Callable[[], T]],
+    *,
+    max_concurrency: int,
+    return_exceptions: bool = False,
+) -> List[Union[T, Exception]]:
+    """Run ``calls`` on a thread pool with at most ``max_concurrency`` in flight.
+
+    Results are returned in the order of ``calls``. With ``return_exceptions`` a
+    failing call contributes its exception instance instead of aborting the batch;
+    otherwise the first failure (in call order) is re-raised.
+    """
+    if max_concurrency <= 0:
+        raise ValueError("max_concurrency must be positive")
+    if not calls:
+        return []
+    if len(calls) == 1 or max_concurrency == 1:
+        return [_call(fn, return_exceptions) for fn in calls]
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_concurrency, len(calls)),
+        thread_name_prefix="vikingdb-fanout",
+    ) as executor:
+        futures = [executor.submit(fn) for fn in calls]
+        results: List[Union[T, Exception]] = []
+        first_error: Union[Exception, None] = None
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                if not return_exceptions and first_error is None:
+                    first_error = exc
+                results.append(exc)
+    if first_error is not None:
+        raise first_error
+    return results
+
+
+def _call(fn: Callable[[], T], return_exceptions: bool) -> Union[T, Exception]:
+    try:
+        return fn()
+    except Exception as exc:
+        if not return_exceptions:
+            raise
+        return exc
@@ -0,0 +1,145 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Incremental extraction of one array from a streamed JSON document."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, List, Optional, Sequence, Tuple
+
+_STRUCTURAL = re.compile(r'["{}\[\],:]')
+_STRING_TAIL = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+_WHITESPACE = " \t\r\n"
+_ELEMENT_END = _WHITESPACE + ",]"
+
+
+class JSONArrayStream:
+    """Pull the elements of the array at ``path`` out of a JSON document fed in chunks.
+
+    Elements are decoded as soon as their closing bytes arrive, so only one
+    element (plus the unread tail of the current chunk) is buffered at a time.
+    Everything outside the array is kept, with the array replaced by ``[]``, and
+    is available from :meth:`envelope` once the document has been fully fed.
+    """
+
+    def __init__(self, path: Sequence[str]) -> None:
+        if not path:
+            raise ValueError("path must name at least one key")
+        self._path: Tuple[str, ...] = tuple(path)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._envelope: List[str] = []
+        # One frame per open container: (is_object, path of the container or None, last key).
+        self._stack: List[List[Any]] = []
+        self._expect_key = False
+        self._in_array = False
+        self._retry_at = 0
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Consume the next chunk and return the array elements it completed."""
+        self._buffer += self._decoder.decode(data)
+        return self._drain(final=False)
+
+    def close(self) -> List[Any]:
+        """Flush the decoder at end of input and return any remaining elements."""
+        self._buffer += self._decoder.decode(b"", final=True)
+        items = self._drain(final=True)
+        if self._buffer.strip() or self._in_array or self._stack:
+            raise ValueError("truncated JSON document")
+        return items
+
+    def envelope(self) -> Any:
+        """Return the document without the streamed array's elements."""
+        return json.loads("".join(self._envelope))
+
+    def _drain(self, *, final: bool) -> List[Any]:
+        items: List[Any] = []
+        buffer = self._buffer
+        pos = 0
+        while pos < len(buffer):
+            if self._in_array:
+                pos, done = self._array_step(buffer, pos, items, final)
+                if not done:
+                    break
+                continue
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                self._envelope.append(buffer[pos:])
+                pos = len(buffer)
+                break
+            start = match.start()
+            char = buffer[start]
+            if char == '"':
+                tail = _STRING_TAIL.match(buffer, start + 1)
+                if tail is None:
+                    self._envelope.append(buffer[pos:start])
+                    pos = start
+                    break
+                literal = buffer[start:tail.end()]
+                self._envelope.append(buffer[pos:tail.end()])
+                if self._stack and self._stack[-1][0] and self._expect_key:
+                    self._stack[-1][2] = json.loads(literal)
+                pos = tail.end()
+                continue
+            self._envelope.append(buffer[pos:start + 1])
+            pos = start + 1
+            self._structural(char)
+        self._buffer = buffer[pos:]
+        return items
+
+    def _structural(self, char: str) -> None:
+        if char in "{[":
+            parent = self._stack[-1] if self._stack else None
+            if parent is None:
+                path: Optional[Tuple[str, ...]] = ()
+            elif parent[0] and parent[1] is not None:
+                path = parent[1] + (parent[2],)
+            else:
+                path = None
+            if char == "[" and path == self._path:
+                self._in_array = True
+                self._retry_at = 0
+                return
+            self._stack.append([char == "{", path if char == "{" else None, None])
+            self._expect_key = char == "{"
+        elif char in "}]":
+            self._stack.pop()
+            self._expect_key = False
+        elif char == ",":
+            self._expect_key = bool(self._stack and self._stack[-1][0])
+        elif char == ":":
+            self._expect_key = False
+
+    def _array_step(self, buffer: str, pos: int, items: List[Any], final: bool) -> Tuple[int, bool]:
+        while pos < len(buffer) and (buffer[pos] in _WHITESPACE or buffer[pos] == ","):
+            pos += 1
+        if pos >= len(buffer):
+            return pos, False
+        if buffer[pos] == "]":
+            self._in_array = False
+            self._envelope.append("]")
+            self._expect_key = False
+            return pos + 1, True
+        # Re-decoding a partial element on every chunk would be quadratic in its size,
+        # so wait until the pending text has doubled before trying again.
+        if not final and len(buffer) - pos < self._retry_at:
+            return pos, False
+        try:
+            item, end = self._json.raw_decode(buffer, pos)
+        except ValueError:
+            if final:
+                raise
+            self._retry_at = 2 * (len(buffer) - pos)
+            return pos, False
+        if not final and (end >= len(buffer) or buffer[end] not in _ELEMENT_END):
+            # A number may continue in the next chunk (``12`` of ``123``, ``-0`` of
+            # ``-0.5``); an element is only complete once a delimiter follows it.
+            self._retry_at = 0
+            return pos, False
+        self._retry_at = 0
+        items.append(item)
+        return end, True
@@ -0,0 +1,137 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Low-overhead request body construction shared by the service clients."""
+
+from __future__ import annotations
+
+import io
+import json
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Mapping, Sequence, Type
+
+from pydantic import BaseModel
+
+_SCALARS = (str, int, float, bool)
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+
+@lru_cache(maxsize=None)
+def _aliases(model_cls: Type[BaseModel]) -> Dict[str, str]:
+    return {name: field.alias or name for name, field in model_cls.model_fields.items()}
+
+
+def dump_model(model: BaseModel) -> Dict[str, Any]:
+    """Equivalent of ``model.model_dump(by_alias=True, exclude_none=True)`` for request models.
+
+    Uses a per-class alias map and returns containers of scalars (vectors, id
+    lists) by reference instead of copying them, which is what dominates
+    ``model_dump`` for embedding-sized payloads. The result is meant to be
+    serialized right away, not mutated.
+    """
+    aliases = _aliases(type(model))
+    body: Dict[str, Any] = {}
+    for name, value in model.__dict__.items():
+        if value is not None:
+            body[aliases.get(name, name)] = _dump_value(value)
+    extra = model.__pydantic_extra__
+    if extra:
+        for name, value in extra.items():
+            if value is not None:
+                body[name] = _dump_value(value)
+    return body
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return dump_model(value)
+    if isinstance(value, (list, tuple)):
+        if not value or isinstance(value[0], _SCALARS):
+            return value
+        return [_dump_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _dump_value(item) for key, item in value.items()}
+    return value
+
+
+def merge_body(base: Mapping[str, Any], request: Mapping[str, Any]) -> Dict[str, Any]:
+    """Overlay the non-``None`` entries of ``request`` on ``base`` in one copy."""
+    for value in request.values():
+        if value is None:
+            return {**base, **{key: item for key, item in request.items() if item is not None}}
+    return {**base, **request}
+
+
+class EncodedPrefix:
+    """A fixed leading JSON object (e.g. collection meta) encoded once.
+
+    :meth:`body` encodes only the per-call fields and appends them to the cached
+    prefix; when a call overrides one of the fixed keys it falls back to encoding
+    the merged object so the body never carries duplicate keys.
+    """
+
+    __slots__ = ("_fields", "_encoded", "_prefix")
+
+    def __init__(self, fields: Mapping[str, Any]) -> None:
+        self._fields = dict(fields)
+        self._encoded = json.dumps(self._fields)
+        self._prefix = self._encoded[:-1] + (", " if self._fields else "")
+
+    def body(self, payload: Mapping[str, Any]) -> str:
+        if not payload:
+            return self._encoded
+        if not self._fields.keys().isdisjoint(payload.keys()):
+            return json.dumps({**self._fields, **payload})
+        return self._prefix + json.dumps(payload)[1:]
+
+
+def _row_stream_parts(payload: Mapping[str, Any], rows_key: str) -> Iterator[bytes]:
+    """Yield ``payload`` as UTF-8 JSON with ``payload[rows_key]`` encoded one row at a time."""
+    rows: Sequence[Any] = payload.get(rows_key) or []
+    head = json.dumps(
+        {key: value for key, value in payload.items() if key != rows_key},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    yield f'{head[:-1]}{"," if len(head) > 2 else ""}{json.dumps(rows_key)}:['.encode("utf-8")
+    for index, row in enumerate(rows):
+        encoded = json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        yield b"," + encoded if index else encoded
+    yield b"]}"
+
+
+def iter_json_chunks(
+    payload: Mapping[str, Any],
+    rows_key: str,
+    *,
+    chunk_bytes: int = _STREAM_CHUNK_BYTES,
+) -> Iterator[bytes]:
+    """Encode ``payload`` incrementally as roughly ``chunk_bytes`` sized pieces.
+
+    Suitable as a chunked transfer-encoding request body: only the rows of the
+    current chunk are held in encoded form, and encoding overlaps with sending.
+    """
+    pending = []
+    size = 0
+    for part in _row_stream_parts(payload, rows_key):
+        pending.append(part)
+        size += len(part)
+        if size >= chunk_bytes:
+            yield b"".join(pending)
+            pending = []
+            size = 0
+    if pending:
+        yield b"".join(pending)
+
+
+def encode_json_bytes(payload: Mapping[str, Any], rows_key: str) -> bytes:
+    """Encode ``payload`` row by row into a single buffer.
+
+    Unlike ``json.dumps(payload).encode()`` no full-size ``str`` is built first, so
+    the peak is one encoded copy (``BytesIO.getvalue`` hands over its buffer). Used
+    when the whole body must be known up front, e.g. for request signing.
+    """
+    buffer = io.BytesIO()
+    for part in _row_stream_parts(payload, rows_key):
+        buffer.write(part)
+    return buffer.getvalue()
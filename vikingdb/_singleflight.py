@@ -0,0 +1,97 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Coalescing of identical in-flight calls (singleflight)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Share one execution among concurrent callers that use the same key.
+
+    The first caller for a key runs the call; callers arriving while it is in flight
+    wait for it and receive the same result object, or the same exception. Nothing
+    is cached once the call completes. Thread and asyncio callers are tracked
+    separately, the latter per event loop.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, _AsyncCall]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+        assert call is not None
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    async def async_do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        calls = self._async_calls.get(loop)
+        if calls is None:
+            calls = {}
+            self._async_calls[loop] = calls
+        call = calls.get(key)
+        if call is None:
+            # The call runs as its own task so that cancelling any one caller, the
+            # first included, does not cancel it for the others.
+            call = _AsyncCall(loop.create_task(fn()))
+            calls[key] = call
+            call.task.add_done_callback(lambda _task: _forget(calls, key, call))
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Every caller gave up; stop the call and let new callers start afresh.
+                _forget(calls, key, call)
+                call.task.cancel()
+
+
+class _AsyncCall:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+def _forget(calls: Dict[Hashable, _AsyncCall], key: Hashable, call: _AsyncCall) -> None:
+    if calls.get(key) is call:
+        del calls[key]
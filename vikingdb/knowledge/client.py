@@ -4,24 +4,30 @@
 
 from __future__ import annotations
 
+import heapq
 import json
-from typing import Mapping, Optional, Union, Sequence, Iterable
+from functools import partial
+from typing import Any, Dict, List, Mapping, Optional, Union, Sequence, Iterable
 
 from volcengine.ApiInfo import ApiInfo
 
 from .. import APIKey
 from .._client import Client, _REQUEST_ID_HEADER
+from .._concurrency import run_concurrently
 from ..auth import Auth
 from ..exceptions import VikingException, promote_exception, VikingAPIException
+from ..offload import DecodeOffload
 from .exceptions import EXCEPTION_MAP, VikingKnowledgeException
 from ..version import __version__
 from .models.base import CollectionMeta, Model
-from .models.rerank import RerankDataItem, RerankResponse
+from .models.rerank import RerankDataItem, RerankResponse, RerankResult
 from .models.chat import ChatCompletionRequest, ChatCompletionResponse
 from .models.service_chat import ServiceChatRequest, ServiceChatResponse
 
 
 _DEFAULT_USER_AGENT = f"vikingdb-python-sdk/{__version__}"
+_RERANK_CHUNK_SIZE = 50
+_DEFAULT_RERANK_CONCURRENCY = 4
 
 
 def _get_common_viking_request_header():
@@ -34,6 +40,20 @@ def _get_common_viking_request_header():
 
 
 class VikingKnowledge(Client):
+    _idempotent_apis = frozenset(
+        {
+            "SearchCollection",
+            "SearchKnowledge",
+            "GetDocInfo",
+            "ListDocs",
+            "ListDocsV2",
+            "SearchDocsByFilter",
+            "GetPointInfo",
+            "ListPoints",
+            "Rerank",
+        }
+    )
+
     def __init__(
         self,
         *,
@@ -43,6 +63,8 @@ class VikingKnowledge(Client):
         sts_token: str = "",
         scheme: str = "http",
         timeout: int = 30,
+        singleflight: bool = False,
+        decode_offload: Optional[DecodeOffload] = None,
     ):
         super().__init__(
             host=host,
@@ -52,6 +74,8 @@ class VikingKnowledge(Client):
             sts_token=sts_token,
             scheme=scheme,
             timeout=timeout,
+            singleflight=singleflight,
+            decode_offload=decode_offload,
         )
 
     def _build_api_info(self):
@@ -134,24 +158,70 @@ class VikingKnowledge(Client):
         rerank_model: str = "Doubao-pro-4k-rerank",
         rerank_instruction: Optional[str] = None,
         endpoint_id: Optional[str] = None,
+        top_k: Optional[int] = None,
+        max_concurrency: int = _DEFAULT_RERANK_CONCURRENCY,
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> RerankResponse:
+        """Score ``datas`` against their queries.
+
+        Inputs larger than the service limit of 50 items are split into chunks that are
+        sent concurrently (at most ``max_concurrency`` at a time). ``result.scores``
+        always lines up with ``datas`` and ``token_usage`` is summed over the chunks.
+        With ``top_k``, ``result.top_indices`` lists the positions of the ``top_k``
+        highest scores, best first.
+        """
         items = [
             (d.model_dump(by_alias=True, exclude_none=True) if isinstance(d, RerankDataItem) else dict(d))
             for d in datas
         ]
-        if len(items) > 50:
-            raise VikingKnowledgeException(1000028, "missed", "datas list too large", status_code=None)
-        payload: dict = {"datas": items, "rerank_model": rerank_model}
+        payload: dict = {"rerank_model": rerank_model}
         if rerank_instruction is not None:
             payload["rerank_instruction"] = rerank_instruction
         if endpoint_id is not None:
             payload["endpoint_id"] = endpoint_id
-        res = self.json_exception("Rerank", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        chunks = [items[i:i + _RERANK_CHUNK_SIZE] for i in range(0, len(items), _RERANK_CHUNK_SIZE)] or [[]]
+        responses = run_concurrently(
+            [partial(self._rerank_chunk, payload, chunk, headers, timeout) for chunk in chunks],
+            max_concurrency=max_concurrency,
+        )
+        response = responses[0] if len(responses) == 1 else self._merge_rerank(responses)
+        if top_k is not None and response.result is not None:
+            scores = response.result.scores
+            response.result.top_indices = heapq.nlargest(top_k, range(len(scores)), key=scores.__getitem__)
+        return response
+
+    def _rerank_chunk(
+        self,
+        payload: Mapping[str, Any],
+        items: List[Dict[str, Any]],
+        headers: Optional[Mapping[str, str]],
+        timeout: Optional[int],
+    ) -> RerankResponse:
+        body = {"datas": items, **payload}
+        res = self.json_exception("Rerank", {}, json.dumps(body), headers=headers, timeout=timeout)
         response = RerankResponse.parse_with(res)
+        scores = response.result.scores if response.result else []
+        if items and len(scores) != len(items):
+            raise VikingKnowledgeException(
+                1000028, "missed", "rerank returned %d scores for %d datas" % (len(scores), len(items)), status_code=None
+            )
         return response
 
+    @staticmethod
+    def _merge_rerank(responses: Sequence[RerankResponse]) -> RerankResponse:
+        scores: List[float] = []
+        token_usage: Optional[int] = None
+        for response in responses:
+            if response.result is None:
+                continue
+            scores.extend(response.result.scores)
+            if response.result.token_usage is not None:
+                token_usage = (token_usage or 0) + response.result.token_usage
+        merged = responses[0].model_copy()
+        merged.result = RerankResult(scores=scores, token_usage=token_usage)
+        return merged
+
     def chat_completion(
         self,
         request: Union[ChatCompletionRequest, Mapping[str, object]],
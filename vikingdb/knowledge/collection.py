@@ -4,10 +4,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Mapping, Optional, Union, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Mapping, Optional, Type, Union, List
 import warnings
 
+from .._payload import EncodedPrefix, dump_model
 from .models.base import CollectionMeta, CommonResponse, Model
 from .models.doc import DocInfo, ListDocsResponse, ListDocsV2Response, SearchDocsByFilterResponse, AddDocRequest, ListDocsRequest, ListDocsV2Request, SearchDocsByFilterRequest, MetaItem, AddDocV2Request, AddDocResponse
 from .models.point import (
@@ -26,12 +29,48 @@ from .models.search import (
     SearchKnowledgeRequest,
 )
 
+_DEFAULT_PAGE_SIZE = 100
+
+_Advance = Callable[[Mapping[str, Any], Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+def _page_data(response: Mapping[str, Any]) -> Mapping[str, Any]:
+    data = response.get("data")
+    return data if isinstance(data, dict) else {}
+
+
+def _next_docs_payload(response: Mapping[str, Any], payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    data = _page_data(response)
+    token = data.get("next_token")
+    if not token or data.get("has_more") is False:
+        return None
+    return {**payload, "next_token": token}
+
+
+def _next_points_payload(response: Mapping[str, Any], payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    received = len(_page_data(response).get("point_list") or [])
+    if received < payload["limit"]:
+        return None
+    offset = int(payload.get("offset") or 0) + received
+    # ListPoints reports total_num next to ``data``, not inside it (see ListPointsResponse).
+    total = response.get("total_num")
+    if isinstance(total, int) and offset >= total:
+        return None
+    return {**payload, "offset": offset}
+
 
 class KnowledgeCollection:
     def __init__(self, client, meta: CollectionMeta):
         self.client = client
         self._meta = meta
         self._meta_payload = meta.model_dump(by_alias=True, exclude_none=True)
+        self._meta_body = EncodedPrefix(self._meta_payload)
+
+    @staticmethod
+    def _request_payload(request: Union[Model, Mapping[str, object], None]) -> Dict[str, Any]:
+        if isinstance(request, Model):
+            return dump_model(request)
+        return dict(request or {})
 
     def add_doc(
         self,
@@ -41,13 +80,8 @@ class KnowledgeCollection:
         timeout: Optional[int] = None,
     ):
         warnings.warn("add_doc 已废弃，请使用 add_doc_v2", DeprecationWarning, stacklevel=2)
-        req_payload = (
-            request.model_dump(by_alias=True, exclude_none=True)  # type: ignore[attr-defined]
-            if isinstance(request, Model)
-            else dict(request)
-        )
-        payload = {**self._meta_payload, **req_payload}
-        res = self.client.json_exception("AddDoc", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        req_payload = self._request_payload(request)
+        res = self.client.json_exception("AddDoc", {}, self._meta_body.body(req_payload), headers=headers, timeout=timeout)
         response = AddDocResponse.parse_with(res)
         return response
 
@@ -58,13 +92,8 @@ class KnowledgeCollection:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> AddDocResponse:
-        req_payload = (
-            request.model_dump(by_alias=True, exclude_none=True)  # type: ignore[attr-defined]
-            if isinstance(request, Model)
-            else dict(request)
-        )
-        payload = {**self._meta_payload, **req_payload}
-        res = self.client.json_exception("AddDocV2", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        req_payload = self._request_payload(request)
+        res = self.client.json_exception("AddDocV2", {}, self._meta_body.body(req_payload), headers=headers, timeout=timeout)
         response = AddDocResponse.parse_with(res)
         return response
 
@@ -75,8 +104,8 @@ class KnowledgeCollection:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> CommonResponse:
-        payload = {**self._meta_payload, "doc_id": doc_id}
-        res = self.client.json_exception("DeleteDoc", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        payload = {"doc_id": doc_id}
+        res = self.client.json_exception("DeleteDoc", {}, self._meta_body.body(payload), headers=headers, timeout=timeout)
         response = CommonResponse.model_validate(res)
         return response
 
@@ -88,10 +117,10 @@ class KnowledgeCollection:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> DocInfo:
-        payload = {**self._meta_payload, "doc_id": doc_id}
+        payload = {"doc_id": doc_id}
         if return_token_usage:
             payload["return_token_usage"] = True
-        res = self.client.json_exception("GetDocInfo", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        res = self.client.json_exception("GetDocInfo", {}, self._meta_body.body(payload), headers=headers, timeout=timeout)
         data_obj = res["data"] if isinstance(res, dict) and "data" in res else {}
         if not isinstance(data_obj, dict):
             data_obj = {}
@@ -107,13 +136,8 @@ class KnowledgeCollection:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> ListDocsResponse:
-        req_payload = (
-            request.model_dump(by_alias=True, exclude_none=True)  # type: ignore[attr-defined]
-            if isinstance(request, Model)
-            else dict(request)
-        )
-        payload: dict = {**self._meta_payload, **req_payload}
-        res = self.client.json_exception("ListDocs", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        req_payload = self._request_payload(request)
+        res = self.client.json_exception("ListDocs", {}, self._meta_body.body(req_payload), headers=headers, timeout=timeout)
         response = ListDocsResponse.parse_with(res)
         return response
 
@@ -124,13 +148,8 @@ class KnowledgeCollection:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> ListDocsV2Response:
-        req_payload = (
-            request.model_dump(by_alias=True, exclude_none=True)  # type: ignore[attr-defined]
-            if isinstance(request, Model)
-            else dict(request)
-        )
-        payload: dict = {**self._meta_payload, **req_payload}
-        res = self.client.json_exception("ListDocsV2", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        req_payload = self._request_payload(request)
+        res = self.client.json_exception("ListDocsV2", {}, self._meta_body.body(req_payload), headers=headers, timeout=timeout)
         response = ListDocsV2Response.parse_with(res)
         return response
 
@@ -141,13 +160,8 @@ class KnowledgeCollection:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> SearchDocsByFilterResponse:
-        req_payload = (
-            request.model_dump(by_alias=True, exclude_none=True)  # type: ignore[attr-defined]
-            if isinstance(request, Model)
-            else dict(request)
-        )
-        payload: dict = {**self._meta_payload, **req_payload}
-        res = self.client.json_exception("SearchDocsByFilter", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        req_payload = self._request_payload(request)
+        res = self.client.json_exception("SearchDocsByFilter", {}, self._meta_body.body(req_payload), headers=headers, timeout=timeout)
         response = SearchDocsByFilterResponse.parse_with(res)
         return response
 
@@ -159,8 +173,8 @@ class KnowledgeCollection:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> CommonResponse:
-        payload = {**self._meta_payload, "doc_id": doc_id, "meta": [item.model_dump(by_alias=True) for item in meta]}
-        res = self.client.json_exception("UpdateDocMeta", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        payload = {"doc_id": doc_id, "meta": [item.model_dump(by_alias=True) for item in meta]}
+        res = self.client.json_exception("UpdateDocMeta", {}, self._meta_body.body(payload), headers=headers, timeout=timeout)
         response = CommonResponse.model_validate(res)
         return response
 
@@ -172,8 +186,8 @@ class KnowledgeCollection:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> CommonResponse:
-        payload = {**self._meta_payload, "doc_id": doc_id, "doc_name": doc_name}
-        res = self.client.json_exception("UpdateDoc", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        payload = {"doc_id": doc_id, "doc_name": doc_name}
+        res = self.client.json_exception("UpdateDoc", {}, self._meta_body.body(payload), headers=headers, timeout=timeout)
         response = CommonResponse.model_validate(res)
         return response
 
@@ -185,10 +199,10 @@ class KnowledgeCollection:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> PointInfo:
-        payload = {**self._meta_payload, "point_id": point_id}
+        payload = {"point_id": point_id}
         if get_attachment_link:
             payload["get_attachment_link"] = True
-        res = self.client.json_exception("GetPointInfo", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        res = self.client.json_exception("GetPointInfo", {}, self._meta_body.body(payload), headers=headers, timeout=timeout)
         data_obj = res["data"] if isinstance(res, dict) and "data" in res else {}
         if not isinstance(data_obj, dict):
             data_obj = {}
@@ -204,13 +218,8 @@ class KnowledgeCollection:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> ListPointsResponse:
-        req_payload = (
-            request.model_dump(by_alias=True, exclude_none=True)  # type: ignore[attr-defined]
-            if isinstance(request, Model)
-            else dict(request)
-        )
-        payload: dict = {**self._meta_payload, **req_payload}
-        res = self.client.json_exception("ListPoints", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        req_payload = self._request_payload(request)
+        res = self.client.json_exception("ListPoints", {}, self._meta_body.body(req_payload), headers=headers, timeout=timeout)
         response = ListPointsResponse.parse_with(res)
         return response
 
@@ -221,13 +230,8 @@ class KnowledgeCollection:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> PointAddResponse:
-        req_payload = (
-            request.model_dump(by_alias=True, exclude_none=True)  # type: ignore[attr-defined]
-            if isinstance(request, Model)
-            else dict(request)
-        )
-        payload = {**self._meta_payload, **req_payload}
-        res = self.client.json_exception("AddPoint", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        req_payload = self._request_payload(request)
+        res = self.client.json_exception("AddPoint", {}, self._meta_body.body(req_payload), headers=headers, timeout=timeout)
         response = PointAddResponse.parse_with(res)
         return response
 
@@ -239,13 +243,9 @@ class KnowledgeCollection:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> CommonResponse:
-        upd_payload = (
-            update.model_dump(by_alias=True, exclude_none=True)  # type: ignore[attr-defined]
-            if isinstance(update, Model)
-            else dict(update)
-        )
-        payload = {**self._meta_payload, "point_id": point_id, **upd_payload}
-        res = self.client.json_exception("UpdatePoint", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        upd_payload = self._request_payload(update)
+        payload = {"point_id": point_id, **upd_payload}
+        res = self.client.json_exception("UpdatePoint", {}, self._meta_body.body(payload), headers=headers, timeout=timeout)
         response = CommonResponse.model_validate(res)
         return response
 
@@ -256,13 +256,8 @@ class KnowledgeCollection:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> CommonResponse:
-        req_payload = (
-            request.model_dump(by_alias=True, exclude_none=True)  # type: ignore[attr-defined]
-            if isinstance(request, Model)
-            else dict(request)
-        )
-        payload = {**self._meta_payload, **req_payload}
-        res = self.client.json_exception("DeletePoint", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        req_payload = self._request_payload(request)
+        res = self.client.json_exception("DeletePoint", {}, self._meta_body.body(req_payload), headers=headers, timeout=timeout)
         response = CommonResponse.model_validate(res)
         return response
 
@@ -273,13 +268,9 @@ class KnowledgeCollection:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> SearchResponse:
-        req_payload = (
-            request.model_dump(by_alias=True, exclude_none=True)  # type: ignore[attr-defined]
-            if isinstance(request, Model)
-            else dict(request)
-        )
-        payload: dict = {**self._meta_payload, **req_payload, "name": self._meta.collection_name}
-        res = self.client.json_exception("SearchCollection", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        req_payload = self._request_payload(request)
+        payload = {**req_payload, "name": self._meta.collection_name}
+        res = self.client.json_exception("SearchCollection", {}, self._meta_body.body(payload), headers=headers, timeout=timeout)
         response = SearchResponse.parse_with(res)
         return response
 
@@ -291,12 +282,192 @@ class KnowledgeCollection:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> SearchKnowledgeResponse:
-        req_payload = (
-            request.model_dump(by_alias=True, exclude_none=True)  # type: ignore[attr-defined]
-            if isinstance(request, Model)
-            else dict(request)
-        )
-        payload: dict = {**self._meta_payload, **req_payload, "name": self._meta.collection_name}
-        res = self.client.json_exception("SearchKnowledge", {}, json.dumps(payload), headers=headers, timeout=timeout)
+        req_payload = self._request_payload(request)
+        payload = {**req_payload, "name": self._meta.collection_name}
+        res = self.client.json_exception("SearchKnowledge", {}, self._meta_body.body(payload), headers=headers, timeout=timeout)
         response = SearchKnowledgeResponse.parse_with(res)
         return response
+
+    def iter_docs(
+        self,
+        request: Union[ListDocsV2Request, Mapping[str, object], None] = None,
+        *,
+        page_size: Optional[int] = None,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+        raw: bool = False,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[int] = None,
+    ) -> Iterator[Union[DocInfo, Dict[str, Any]]]:
+        """Iterate over every document, following ``next_token`` automatically.
+
+        The next page is requested in the background while the current one is being
+        consumed. With ``raw=True`` plain dicts are yielded instead of ``DocInfo``.
+        """
+        payload = self._page_payload(request, page_size)
+        return self._iter_pages(
+            "ListDocsV2", payload, _next_docs_payload, "doc_list", DocInfo,
+            max_items=max_items, prefetch=prefetch, raw=raw, headers=headers, timeout=timeout,
+        )
+
+    def iter_points(
+        self,
+        request: Union[ListPointsRequest, Mapping[str, object], None] = None,
+        *,
+        page_size: Optional[int] = None,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+        raw: bool = False,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[int] = None,
+    ) -> Iterator[Union[PointInfo, Dict[str, Any]]]:
+        """Iterate over every point, advancing ``offset`` page by page.
+
+        The next page is requested in the background while the current one is being
+        consumed. With ``raw=True`` plain dicts are yielded instead of ``PointInfo``.
+        """
+        payload = self._page_payload(request, page_size)
+        return self._iter_pages(
+            "ListPoints", payload, _next_points_payload, "point_list", PointInfo,
+            max_items=max_items, prefetch=prefetch, raw=raw, headers=headers, timeout=timeout,
+        )
+
+    def async_iter_docs(
+        self,
+        request: Union[ListDocsV2Request, Mapping[str, object], None] = None,
+        *,
+        page_size: Optional[int] = None,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+        raw: bool = False,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[int] = None,
+    ) -> AsyncIterator[Union[DocInfo, Dict[str, Any]]]:
+        """Asynchronous counterpart of :meth:`iter_docs`."""
+        payload = self._page_payload(request, page_size)
+        return self._async_iter_pages(
+            "ListDocsV2", payload, _next_docs_payload, "doc_list", DocInfo,
+            max_items=max_items, prefetch=prefetch, raw=raw, headers=headers, timeout=timeout,
+        )
+
+    def async_iter_points(
+        self,
+        request: Union[ListPointsRequest, Mapping[str, object], None] = None,
+        *,
+        page_size: Optional[int] = None,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+        raw: bool = False,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[int] = None,
+    ) -> AsyncIterator[Union[PointInfo, Dict[str, Any]]]:
+        """Asynchronous counterpart of :meth:`iter_points`."""
+        payload = self._page_payload(request, page_size)
+        return self._async_iter_pages(
+            "ListPoints", payload, _next_points_payload, "point_list", PointInfo,
+            max_items=max_items, prefetch=prefetch, raw=raw, headers=headers, timeout=timeout,
+        )
+
+    def _page_payload(
+        self,
+        request: Union[Model, Mapping[str, object], None],
+        page_size: Optional[int],
+    ) -> Dict[str, Any]:
+        req_payload = self._request_payload(request)
+        payload: Dict[str, Any] = {**self._meta_payload, **req_payload}
+        if page_size is not None:
+            payload["limit"] = page_size
+        elif not isinstance(payload.get("limit"), int) or payload["limit"] <= 0:
+            payload["limit"] = _DEFAULT_PAGE_SIZE
+        if payload["limit"] <= 0:
+            raise ValueError("page_size must be positive")
+        return payload
+
+    def _list_page(self, api, payload, headers, timeout) -> Mapping[str, Any]:
+        res = self.client.json_exception(api, {}, json.dumps(payload), headers=headers, timeout=timeout)
+        return res if isinstance(res, dict) else {}
+
+    async def _async_list_page(self, api, payload, headers, timeout) -> Mapping[str, Any]:
+        res = await self.client.async_json_exception(api, {}, json.dumps(payload), headers=headers, timeout=timeout)
+        return res if isinstance(res, dict) else {}
+
+    def _iter_pages(
+        self,
+        api: str,
+        payload: Dict[str, Any],
+        advance: _Advance,
+        list_key: str,
+        model: Type[Model],
+        *,
+        max_items: Optional[int],
+        prefetch: bool,
+        raw: bool,
+        headers: Optional[Mapping[str, str]],
+        timeout: Optional[int],
+    ) -> Iterator[Any]:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vikingdb-prefetch") if prefetch else None
+        pending: Optional[Future] = None
+        emitted = 0
+        try:
+            response = self._list_page(api, payload, headers, timeout)
+            while True:
+                next_payload = advance(response, payload)
+                if next_payload is not None and executor is not None:
+                    pending = executor.submit(self._list_page, api, next_payload, headers, timeout)
+                for entry in _page_data(response).get(list_key) or []:
+                    yield entry if raw else model.model_validate(entry)
+                    emitted += 1
+                    if max_items is not None and emitted >= max_items:
+                        return
+                if next_payload is None:
+                    return
+                payload = next_payload
+                if pending is not None:
+                    response, pending = pending.result(), None
+                else:
+                    response = self._list_page(api, payload, headers, timeout)
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    async def _async_iter_pages(
+        self,
+        api: str,
+        payload: Dict[str, Any],
+        advance: _Advance,
+        list_key: str,
+        model: Type[Model],
+        *,
+        max_items: Optional[int],
+        prefetch: bool,
+        raw: bool,
+        headers: Optional[Mapping[str, str]],
+        timeout: Optional[int],
+    ) -> AsyncIterator[Any]:
+        pending: Optional["asyncio.Future[Mapping[str, Any]]"] = None
+        emitted = 0
+        try:
+            response = await self._async_list_page(api, payload, headers, timeout)
+            while True:
+                next_payload = advance(response, payload)
+                if next_payload is not None and prefetch:
+                    pending = asyncio.ensure_future(
+                        self._async_list_page(api, next_payload, headers, timeout)
+                    )
+                for entry in _page_data(response).get(list_key) or []:
+                    yield entry if raw else model.model_validate(entry)
+                    emitted += 1
+                    if max_items is not None and emitted >= max_items:
+                        return
+                if next_payload is None:
+                    return
+                payload = next_payload
+                if pending is not None:
+                    response, pending = await pending, None
+                else:
+                    response = await self._async_list_page(api, payload, headers, timeout)
+        finally:
+            if pending is not None:
+                pending.cancel()
@@ -19,7 +19,8 @@ __all__ = [
 
 
 class Model(BaseModel):
-    model_config = ConfigDict(populate_by_name=True, alias_generator=None, extra="allow")
+    # Validators are compiled on first use of each model rather than at import.
+    model_config = ConfigDict(populate_by_name=True, alias_generator=None, extra="allow", defer_build=True)
 
 
 class CollectionMeta(Model):
@@ -25,6 +25,7 @@ class RerankDataItem(Model):
 class RerankResult(Model):
     scores: List[float] = Field(default_factory=list, alias="scores")
     token_usage: Optional[int] = Field(default=None, alias="token_usage")
+    top_indices: Optional[List[int]] = Field(default=None, alias="top_indices")
 
 class RerankResponse(DataApiResponse):
     result: Optional[RerankResult] = None
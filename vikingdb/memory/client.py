@@ -6,11 +6,14 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from volcengine.ApiInfo import ApiInfo
 
 from .._client import Client
 from ..auth import Auth
 from ..exceptions import VikingException, promote_exception
+from ..offload import DecodeOffload
 from .collection import Collection
 from .exceptions import EXCEPTION_MAP, VikingMemException
 from ..version import __version__
@@ -29,6 +32,15 @@ def _get_common_viking_request_header():
 class VikingMem(Client):
     """Viking Memory Service Main Service Class"""
 
+    _idempotent_apis = frozenset(
+        {
+            "GetSessionInfo",
+            "SearchMemory",
+            "SearchEventMemory",
+            "SearchProfileMemory",
+        }
+    )
+
     def __init__(
         self,
         *,
@@ -38,6 +50,8 @@ class VikingMem(Client):
         sts_token: str = "",
         scheme: str = "http",
         timeout: int = 30,
+        singleflight: bool = False,
+        decode_offload: Optional[DecodeOffload] = None,
     ):
         """
         Initialize Viking Memory Service
@@ -49,6 +63,8 @@ class VikingMem(Client):
             sts_token: STS Token (optional)
             scheme: Request protocol (http or https)
             timeout: Timeout in seconds applied to connection and read operations
+            singleflight: Share one network call among concurrent identical search/read requests
+            decode_offload: Decode large async responses off the event loop (see ``DecodeOffload``)
             
         Note:
             Authentication methods:
@@ -63,6 +79,8 @@ class VikingMem(Client):
             sts_token=sts_token,
             scheme=scheme,
             timeout=timeout,
+            singleflight=singleflight,
+            decode_offload=decode_offload,
         )
 
     def ping(self):
@@ -0,0 +1,162 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Keeping large response decoding off the asyncio event loop, and measuring loop lag."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Optional, Union
+
+__all__ = [
+    "DecodeOffload",
+    "LoopLagMonitor",
+    "LoopLagStats",
+    "OffloadStats",
+]
+
+_DEFAULT_THRESHOLD_BYTES = 256 * 1024
+
+
+@dataclass
+class OffloadStats:
+    """Counters kept by :class:`DecodeOffload`."""
+
+    inline: int = 0
+    offloaded: int = 0
+    inline_seconds: float = 0.0
+    max_inline_seconds: float = 0.0
+    offloaded_bytes: int = 0
+
+
+@dataclass
+class LoopLagStats:
+    """Event loop scheduling delay observed by :class:`LoopLagMonitor`, in seconds."""
+
+    samples: int = 0
+    total_lag: float = 0.0
+    max_lag: float = 0.0
+    last_lag: float = 0.0
+
+    @property
+    def mean_lag(self) -> float:
+        return self.total_lag / self.samples if self.samples else 0.0
+
+
+def _decode(raw: Union[bytes, str]) -> Any:
+    return json.loads(raw)
+
+
+class DecodeOffload:
+    """Decode (and validate) async responses of at least ``threshold_bytes`` in an executor.
+
+    Smaller bodies are decoded inline, where the executor hand-off would cost more
+    than it saves. ``executor`` defaults to the loop's default thread pool. Both
+    ``json.loads`` and pydantic validation keep the GIL for their whole call, so a
+    worker thread splits one long stall into shorter ones rather than removing it;
+    a ``ProcessPoolExecutor`` is accepted but rarely pays off, as unpickling the
+    result on the loop costs about as much as decoding it. With ``validate`` the
+    async vector clients also run pydantic validation of large responses in the
+    executor.
+
+    Pass one to a client as ``decode_offload=``; :attr:`stats` shows how many
+    responses took each path and how long inline decoding held the loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold_bytes: int = _DEFAULT_THRESHOLD_BYTES,
+        executor: Optional[Executor] = None,
+        validate: bool = True,
+    ) -> None:
+        if threshold_bytes < 0:
+            raise ValueError("threshold_bytes must not be negative")
+        self.threshold_bytes = threshold_bytes
+        self.executor = executor
+        self.validate = validate
+        self.stats = OffloadStats()
+        self._lock = threading.Lock()
+
+    def should_offload(self, size: int) -> bool:
+        return size >= self.threshold_bytes
+
+    async def decode(self, raw: Union[bytes, str]) -> Any:
+        """Return ``json.loads(raw)``, decoded in the executor when ``raw`` is large."""
+        return await self.run(_decode, raw, size=len(raw))
+
+    async def run(self, fn: Callable[[Any], Any], value: Any, *, size: int) -> Any:
+        """Apply ``fn`` to ``value``, in the executor when ``size`` reaches the threshold."""
+        if self.should_offload(size):
+            with self._lock:
+                self.stats.offloaded += 1
+                self.stats.offloaded_bytes += size
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, partial(fn, value))
+        started = time.perf_counter()
+        try:
+            return fn(value)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.stats.inline += 1
+                self.stats.inline_seconds += elapsed
+                self.stats.max_inline_seconds = max(self.stats.max_inline_seconds, elapsed)
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop runs a callback scheduled every ``interval`` seconds.
+
+    The lag of each sample is the time past the requested wake-up, i.e. how long
+    other work (such as decoding a large response inline) held the loop. Use as
+    an async context manager, or call :meth:`start` and :meth:`stop` from a
+    coroutine running on the loop to be observed.
+    """
+
+    def __init__(self, *, interval: float = 0.05) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.stats = LoopLagStats()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def reset(self) -> None:
+        self.stats = LoopLagStats()
+
+    async def __aenter__(self) -> "LoopLagMonitor":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - expected)
+            stats = self.stats
+            stats.samples += 1
+            stats.total_lag += lag
+            stats.last_lag = lag
+            stats.max_lag = max(stats.max_lag, lag)
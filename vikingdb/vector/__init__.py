@@ -8,6 +8,12 @@ from .collection import CollectionClient
 from .embedding import EmbeddingClient
 from .rerank import RerankClient
 from .index import IndexClient
+from .batching import FetchLoader, MicroBatchEmbedder
+from .cache import CacheStats, EmbeddingCache, ItemCache, SearchResultCache, SemanticQueryCache
+from .fusion import merge_top_k, reciprocal_rank_fusion, weighted_score_fusion
+from .prepared import PreparedVectorSearch
+from .postprocess import maxsim_scores, mmr_select
+from .federated import FederatedHit, FederatedSearch, FederatedSearchResult, ShardResult
 from .models import CollectionMeta, IndexMeta, __all__ as _models_all  # noqa: F401
 from .models import *  # noqa: F401,F403
 from .exceptions import VikingVectorException
@@ -18,6 +24,23 @@ __all__ = [
     "IndexClient",
     "EmbeddingClient",
     "RerankClient",
+    "FetchLoader",
+    "MicroBatchEmbedder",
+    "CacheStats",
+    "EmbeddingCache",
+    "ItemCache",
+    "SearchResultCache",
+    "SemanticQueryCache",
+    "PreparedVectorSearch",
+    "FederatedHit",
+    "FederatedSearch",
+    "FederatedSearchResult",
+    "ShardResult",
+    "merge_top_k",
+    "maxsim_scores",
+    "mmr_select",
+    "reciprocal_rank_fusion",
+    "weighted_score_fusion",
     "VikingVectorException",
 ] + list(_models_all)
 
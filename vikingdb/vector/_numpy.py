@@ -0,0 +1,18 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Lazy access to the optional NumPy dependency."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def require_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ImportError(
+            "this feature requires numpy; install it with `pip install vikingdb-python-sdk[numpy]`"
+        ) from exc
+    return numpy
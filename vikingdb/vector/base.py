@@ -3,16 +3,41 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Mapping, Optional, Type, Union
+import json
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Mapping, Optional, Type, Union
 
 from pydantic import BaseModel
 
+from .._payload import dump_model, merge_body
 from ..request_options import RequestOptions
 
 if TYPE_CHECKING:
     from .client import VikingDB
 
 
+def sum_token_usage(usages: Iterable[Optional[Mapping[str, Any]]]) -> Dict[str, Any]:
+    """Combine the ``token_usage`` maps of several sub-requests.
+
+    Numeric counters are summed per key and nested maps (e.g. per model) are
+    combined the same way; any other value keeps its first occurrence.
+    """
+    total: Dict[str, Any] = {}
+    for usage in usages:
+        for key, value in (usage or {}).items():
+            current = total.get(key)
+            if key not in total:
+                total[key] = sum_token_usage([value]) if isinstance(value, Mapping) else value
+            elif isinstance(current, dict) and isinstance(value, Mapping):
+                total[key] = sum_token_usage([current, value])
+            elif _is_counter(current) and _is_counter(value):
+                total[key] = current + value
+    return total
+
+
+def _is_counter(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
 class VectorClientBase:
     """Shared helper for all Vector clients."""
 
@@ -30,22 +55,41 @@ class VectorClientBase:
         response_payload = self._service.request(api, payload, options=request_options)
         return response_model.model_validate(response_payload)
 
+    async def _async_post(
+        self,
+        api: str,
+        payload: Mapping[str, Any],
+        response_model: Type[BaseModel],
+        *,
+        request_options: Optional[RequestOptions] = None,
+    ) -> BaseModel:
+        response_payload = await self._service.async_request(
+            api,
+            payload,
+            options=request_options,
+            parse=response_model.model_validate,
+        )
+        if isinstance(response_payload, response_model):
+            return response_payload
+        return response_model.model_validate(response_payload)
+
     @staticmethod
     def _merge_payload(
         base: Mapping[str, Any],
         request: Union[BaseModel, Mapping[str, Any], None],
     ) -> Mapping[str, Any]:
         if isinstance(request, BaseModel):
-            body = request.model_dump(by_alias=True, exclude_none=True)
+            return {**base, **dump_model(request)}
         elif request is None:
-            body = {}
+            return dict(base)
         elif isinstance(request, Mapping):
-            body = {key: value for key, value in request.items() if value is not None}
+            return merge_body(base, request)
         else:
             raise Exception(
                 f"unsupported request type: {type(request)!r}"
             )
 
-        merged = dict(base)
-        merged.update(body)
-        return merged
+    @staticmethod
+    def _payload_key(payload: Mapping[str, Any]) -> str:
+        """Return a canonical string identifying ``payload`` regardless of key order."""
+        return json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
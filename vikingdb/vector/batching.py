@@ -0,0 +1,462 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Automatic request batching for high fan-in vector workloads."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from ..request_options import RequestOptions
+from .exceptions import VikingVectorException
+from .models import Embedding, EmbeddingData, EmbeddingModelOpt
+
+if TYPE_CHECKING:
+    from .collection import CollectionClient
+    from .embedding import EmbeddingClient
+    from .index import IndexClient
+
+TItem = TypeVar("TItem")
+TResult = TypeVar("TResult")
+
+__all__ = ["FetchLoader", "MicroBatchEmbedder"]
+
+
+class _LoopState:
+    __slots__ = ("pending", "handle", "tasks", "semaphore")
+
+    def __init__(self, max_inflight: int) -> None:
+        self.pending: List[Tuple[Any, "asyncio.Future[Any]"]] = []
+        self.handle: Optional[asyncio.TimerHandle] = None
+        self.tasks: Set["asyncio.Task[None]"] = set()
+        self.semaphore = asyncio.Semaphore(max_inflight)
+
+
+class _Batcher(Generic[TItem, TResult]):
+    """Collect submissions for a short window and dispatch them as one batch.
+
+    ``batch_fn`` (threads) and ``async_batch_fn`` (asyncio) receive the collected
+    items and must return exactly one result per item, in order. A window closes
+    ``max_wait_ms`` after its first submission or once ``max_batch_size`` items are
+    queued, whichever comes first. At most ``max_inflight`` batches run at once.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[TItem]], Sequence[TResult]],
+        async_batch_fn: Callable[[List[TItem]], Awaitable[Sequence[TResult]]],
+        *,
+        max_batch_size: int,
+        max_wait_ms: float,
+        max_inflight: int,
+    ) -> None:
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be positive")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must not be negative")
+        if max_inflight <= 0:
+            raise ValueError("max_inflight must be positive")
+        self._batch_fn = batch_fn
+        self._async_batch_fn = async_batch_fn
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000.0
+        self._max_inflight = max_inflight
+
+        self._cond = threading.Condition()
+        self._pending: List[Tuple[TItem, "Future[TResult]"]] = []
+        self._deadline = 0.0
+        self._closed = False
+        self._worker: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self._loop_states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    # ------------------------------------------------------------------ threads
+
+    def submit(self, item: TItem) -> "Future[TResult]":
+        future: "Future[TResult]" = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("batcher is closed")
+            if not self._pending:
+                self._deadline = time.monotonic() + self._max_wait
+            self._pending.append((item, future))
+            if self._worker is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_inflight,
+                    thread_name_prefix="vikingdb-batch",
+                )
+                self._worker = threading.Thread(
+                    target=self._run_worker,
+                    name="vikingdb-batcher",
+                    daemon=True,
+                )
+                self._worker.start()
+            self._cond.notify()
+        return future
+
+    def _run_worker(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                while len(self._pending) < self._max_batch_size and not self._closed:
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = self._pending[: self._max_batch_size]
+                del self._pending[: self._max_batch_size]
+            assert self._executor is not None
+            self._executor.submit(self._dispatch, batch)
+
+    def _dispatch(self, batch: List[Tuple[TItem, "Future[TResult]"]]) -> None:
+        try:
+            results = self._batch_fn([item for item, _ in batch])
+        except BaseException as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    # ------------------------------------------------------------------ asyncio
+
+    async def async_submit(self, item: TItem) -> TResult:
+        loop = asyncio.get_running_loop()
+        state = self._loop_states.get(loop)
+        if state is None:
+            state = _LoopState(self._max_inflight)
+            self._loop_states[loop] = state
+        if self._closed:
+            raise RuntimeError("batcher is closed")
+        future: "asyncio.Future[TResult]" = loop.create_future()
+        state.pending.append((item, future))
+        if len(state.pending) >= self._max_batch_size:
+            self._flush_async(loop, state)
+        elif state.handle is None:
+            state.handle = loop.call_later(self._max_wait, self._flush_async, loop, state)
+        return await future
+
+    def _flush_async(self, loop: asyncio.AbstractEventLoop, state: _LoopState) -> None:
+        if state.handle is not None:
+            state.handle.cancel()
+            state.handle = None
+        while state.pending:
+            batch = state.pending[: self._max_batch_size]
+            del state.pending[: self._max_batch_size]
+            task = loop.create_task(self._dispatch_async(batch, state))
+            state.tasks.add(task)
+            task.add_done_callback(state.tasks.discard)
+
+    async def _dispatch_async(
+        self,
+        batch: List[Tuple[TItem, "asyncio.Future[TResult]"]],
+        state: _LoopState,
+    ) -> None:
+        async with state.semaphore:
+            try:
+                results = await self._async_batch_fn([item for item, _ in batch])
+            except BaseException as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                if isinstance(exc, asyncio.CancelledError):
+                    raise
+                return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    # ------------------------------------------------------------------ lifecycle
+
+    def close(self) -> None:
+        """Flush queued thread submissions and stop the background worker."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            worker, executor = self._worker, self._executor
+        if worker is not None:
+            worker.join()
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def _id_key(value: Any) -> str:
+    return str(value)
+
+
+class FetchLoader:
+    """DataLoader-style coalescing of single-id fetches into batched fetch calls.
+
+    Ids requested by independent threads or coroutines within ``max_wait_ms`` of
+    each other (or until ``max_batch_size`` ids are queued) are resolved by one
+    ``fetch_in_collection``/``fetch_in_index`` call, and every caller receives only
+    its own item, or ``None`` when the id does not exist.
+
+    Example::
+
+        loader = FetchLoader(client.collection(collection_name="docs"))
+        item = loader.load(42)              # from any thread
+        item = await loader.async_load(42)  # from any event loop
+    """
+
+    def __init__(
+        self,
+        client: Union["CollectionClient", "IndexClient"],
+        *,
+        request: Optional[Mapping[str, object]] = None,
+        max_batch_size: int = 100,
+        max_wait_ms: float = 2.0,
+        max_inflight: int = 4,
+        request_options: Optional[RequestOptions] = None,
+    ) -> None:
+        """
+        Args:
+            client: Collection or index client used to issue the batched fetches.
+            request: Static fetch fields shared by every batch (e.g. ``output_fields``
+                or ``partition`` for index fetches). ``ids`` is filled per batch.
+            max_batch_size: Maximum number of ids sent in one fetch call.
+            max_wait_ms: How long the first queued id waits for others to join.
+            max_inflight: Maximum number of fetch calls running concurrently.
+            request_options: Per-request overrides applied to every batched fetch.
+        """
+        self._client = client
+        self._template: Dict[str, object] = {
+            key: value for key, value in (request or {}).items() if key != "ids"
+        }
+        self._request_options = request_options
+        self._batcher: _Batcher[Any, Any] = _Batcher(
+            self._fetch_batch,
+            self._async_fetch_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_inflight=max_inflight,
+        )
+
+    def load(self, id: Any, *, timeout: Optional[float] = None) -> Any:
+        """Return the item for ``id``, blocking until its batch completes."""
+        return self._batcher.submit(id).result(timeout)
+
+    def load_many(self, ids: Sequence[Any], *, timeout: Optional[float] = None) -> List[Any]:
+        """Return items for ``ids`` in order; missing ids resolve to ``None``."""
+        futures = [self._batcher.submit(id) for id in ids]
+        return [future.result(timeout) for future in futures]
+
+    async def async_load(self, id: Any) -> Any:
+        """Asynchronously return the item for ``id``."""
+        return await self._batcher.async_submit(id)
+
+    async def async_load_many(self, ids: Sequence[Any]) -> List[Any]:
+        """Asynchronously return items for ``ids`` in order."""
+        return list(await asyncio.gather(*(self._batcher.async_submit(id) for id in ids)))
+
+    def close(self) -> None:
+        """Flush pending thread loads and release the background worker."""
+        self._batcher.close()
+
+    def __enter__(self) -> "FetchLoader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _build_request(self, ids: List[Any]) -> Dict[str, object]:
+        request = dict(self._template)
+        request["ids"] = list(dict.fromkeys(ids))
+        return request
+
+    @staticmethod
+    def _resolve(ids: List[Any], response: Any) -> List[Any]:
+        result = getattr(response, "result", None)
+        found = {_id_key(item.id): item for item in (result.items if result else [])}
+        return [found.get(_id_key(id)) for id in ids]
+
+    def _fetch_batch(self, ids: List[Any]) -> List[Any]:
+        response = self._client.fetch(
+            self._build_request(ids),
+            request_options=self._request_options,
+        )
+        return self._resolve(ids, response)
+
+    async def _async_fetch_batch(self, ids: List[Any]) -> List[Any]:
+        response = await self._client.async_fetch(
+            self._build_request(ids),
+            request_options=self._request_options,
+        )
+        return self._resolve(ids, response)
+
+
+_ModelOpt = Union[EmbeddingModelOpt, Mapping[str, object], None]
+
+
+def _dump(value: Union[BaseModel, Mapping[str, object], None]) -> Optional[Dict[str, Any]]:
+    if value is None:
+        return None
+    if isinstance(value, BaseModel):
+        return value.model_dump(by_alias=True, exclude_none=True)
+    return {key: item for key, item in value.items() if item is not None}
+
+
+class MicroBatchEmbedder:
+    """Dynamic micro-batching front-end for :class:`EmbeddingClient`.
+
+    Single-item ``embed`` calls from many threads or coroutines are grouped per
+    model configuration (``dense_model``/``sparse_model``/``tensor_model``) for up to
+    ``max_wait_ms`` or ``max_batch_size`` items, sent as one ``EmbeddingRequest``,
+    and each caller receives the ``Embedding`` for its own input.
+
+    Example::
+
+        embedder = MicroBatchEmbedder(client.embedding())
+        vector = embedder.embed({"text": "hello"}, dense_model={"name": "bge-m3"}).dense
+    """
+
+    def __init__(
+        self,
+        client: "EmbeddingClient",
+        *,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_inflight: int = 4,
+        project_name: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> None:
+        """
+        Args:
+            client: Embedding client used to send the batched requests.
+            max_batch_size: Maximum number of inputs per ``EmbeddingRequest``.
+            max_wait_ms: How long the first queued input waits for others to join.
+            max_inflight: Maximum concurrent requests per model configuration.
+            project_name: Optional project forwarded with every request.
+            request_options: Per-request overrides applied to every batched request.
+        """
+        self._client = client
+        self._max_batch_size = max_batch_size
+        self._max_wait_ms = max_wait_ms
+        self._max_inflight = max_inflight
+        self._project_name = project_name
+        self._request_options = request_options
+        self._lock = threading.Lock()
+        self._batchers: Dict[str, _Batcher[Dict[str, Any], Embedding]] = {}
+
+    def embed(
+        self,
+        data: Union[EmbeddingData, Mapping[str, object]],
+        *,
+        dense_model: _ModelOpt = None,
+        sparse_model: _ModelOpt = None,
+        tensor_model: _ModelOpt = None,
+        timeout: Optional[float] = None,
+    ) -> Embedding:
+        """Embed one input, blocking until its batch completes."""
+        batcher = self._batcher_for(dense_model, sparse_model, tensor_model)
+        return batcher.submit(_dump(data) or {}).result(timeout)
+
+    async def async_embed(
+        self,
+        data: Union[EmbeddingData, Mapping[str, object]],
+        *,
+        dense_model: _ModelOpt = None,
+        sparse_model: _ModelOpt = None,
+        tensor_model: _ModelOpt = None,
+    ) -> Embedding:
+        """Asynchronously embed one input."""
+        batcher = self._batcher_for(dense_model, sparse_model, tensor_model)
+        return await batcher.async_submit(_dump(data) or {})
+
+    def close(self) -> None:
+        """Flush pending thread submissions and release background workers."""
+        with self._lock:
+            batchers = list(self._batchers.values())
+            self._batchers.clear()
+        for batcher in batchers:
+            batcher.close()
+
+    def __enter__(self) -> "MicroBatchEmbedder":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _batcher_for(
+        self,
+        dense_model: _ModelOpt,
+        sparse_model: _ModelOpt,
+        tensor_model: _ModelOpt,
+    ) -> "_Batcher[Dict[str, Any], Embedding]":
+        models = {
+            "dense_model": _dump(dense_model),
+            "sparse_model": _dump(sparse_model),
+            "tensor_model": _dump(tensor_model),
+            "project_name": self._project_name,
+        }
+        models = {key: value for key, value in models.items() if value is not None}
+        key = json.dumps(models, sort_keys=True, separators=(",", ":"), default=str)
+        with self._lock:
+            batcher = self._batchers.get(key)
+            if batcher is None:
+                batcher = _Batcher(
+                    functools.partial(self._embed_batch, models),
+                    functools.partial(self._async_embed_batch, models),
+                    max_batch_size=self._max_batch_size,
+                    max_wait_ms=self._max_wait_ms,
+                    max_inflight=self._max_inflight,
+                )
+                self._batchers[key] = batcher
+        return batcher
+
+    @staticmethod
+    def _unpack(items: List[Dict[str, Any]], response: Any) -> List[Embedding]:
+        embeddings = list(response.result.data) if response.result else []
+        if len(embeddings) != len(items):
+            raise VikingVectorException(
+                "InternalServerError",
+                response.request_id or "unknown",
+                f"embedding returned {len(embeddings)} results for {len(items)} inputs",
+            )
+        return embeddings
+
+    def _embed_batch(self, models: Mapping[str, Any], items: List[Dict[str, Any]]) -> List[Embedding]:
+        response = self._client.embedding(
+            {**models, "data": items},
+            request_options=self._request_options,
+        )
+        return self._unpack(items, response)
+
+    async def _async_embed_batch(self, models: Mapping[str, Any], items: List[Dict[str, Any]]) -> List[Embedding]:
+        response = await self._client.async_embedding(
+            {**models, "data": items},
+            request_options=self._request_options,
+        )
+        return self._unpack(items, response)
@@ -0,0 +1,459 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Client-side caches for vector clients."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import struct
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, Hashable, List, Mapping, Optional, Sequence, Set, Tuple, TypeVar
+
+from ._numpy import require_numpy
+from .models import DataItem, Embedding, SearchResponse
+
+__all__ = [
+    "CacheStats",
+    "EmbeddingCache",
+    "ItemCache",
+    "SearchResultCache",
+    "SemanticQueryCache",
+]
+
+V = TypeVar("V")
+
+_NO_DENSE = 0xFFFFFFFF
+_HEADER = struct.Struct("<II")
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters exposed by every client-side cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _LRUStore(Generic[V]):
+    """Thread-safe LRU map bounded by total bytes and/or entry count, with optional TTL."""
+
+    def __init__(
+        self,
+        *,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[V, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            value, size, expires_at = entry
+            if expires_at and expires_at <= time.monotonic():
+                del self._entries[key]
+                self._bytes -= size
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: V, size: int = 1) -> None:
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+        expires_at = time.monotonic() + self._ttl if self._ttl else 0.0
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+            while self._entries and (
+                (self._max_bytes is not None and self._bytes > self._max_bytes)
+                or (self._max_entries is not None and len(self._entries) > self._max_entries)
+            ):
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.stats.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+def _encode_embedding(embedding: Embedding) -> bytes:
+    dense = embedding.dense
+    dense_bytes = array("f", dense).tobytes() if dense is not None else b""
+    sparse_bytes = (
+        json.dumps(embedding.sparse, separators=(",", ":")).encode("utf-8")
+        if embedding.sparse is not None
+        else b""
+    )
+    header = _HEADER.pack(len(dense) if dense is not None else _NO_DENSE, len(sparse_bytes))
+    return header + dense_bytes + sparse_bytes
+
+
+def _decode_embedding(blob: bytes) -> Embedding:
+    dense_len, sparse_len = _HEADER.unpack_from(blob)
+    offset = _HEADER.size
+    dense: Optional[List[float]] = None
+    if dense_len != _NO_DENSE:
+        values = array("f")
+        values.frombytes(blob[offset : offset + dense_len * values.itemsize])
+        dense = values.tolist()
+        offset += dense_len * values.itemsize
+    sparse = json.loads(blob[offset : offset + sparse_len]) if sparse_len else None
+    return Embedding(dense=dense, sparse=sparse)
+
+
+class _SQLiteTier:
+    def __init__(self, path: str) -> None:
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        found: Dict[str, bytes] = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                found.update((key, bytes(value)) for key, value in rows)
+        return found
+
+    def put_many(self, items: Mapping[str, bytes]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, value) VALUES (?, ?)",
+                list(items.items()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class EmbeddingCache:
+    """Content-addressed cache for ``EmbeddingClient.embedding`` results.
+
+    Entries are keyed by a SHA-256 of the input item together with the dense and
+    sparse model options (name, version, dim, instruction, ...), so the same text or
+    image URL embedded with the same model is only sent to the server once. Vectors
+    are stored as packed float32 in an in-memory LRU bounded by ``max_bytes`` and,
+    when ``path`` is given, in a SQLite database that survives restarts.
+    """
+
+    def __init__(self, *, max_bytes: int = 64 * 1024 * 1024, path: Optional[str] = None) -> None:
+        self._memory: _LRUStore[bytes] = _LRUStore(max_bytes=max_bytes)
+        self._disk = _SQLiteTier(path) if path else None
+        self.stats = CacheStats()
+
+    @staticmethod
+    def key(item: Mapping[str, Any], models: Mapping[str, Any]) -> str:
+        """Return the content address of ``item`` embedded with ``models``."""
+        material = json.dumps(
+            {"data": item, "models": models},
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, Embedding]:
+        found: Dict[str, Embedding] = {}
+        missing: List[str] = []
+        for key in keys:
+            blob = self._memory.get(key)
+            if blob is None:
+                missing.append(key)
+            else:
+                found[key] = _decode_embedding(blob)
+        if missing and self._disk is not None:
+            for key, blob in self._disk.get_many(missing).items():
+                self._memory.put(key, blob, len(blob))
+                found[key] = _decode_embedding(blob)
+        self.stats.hits += len(found)
+        self.stats.misses += len(keys) - len(found)
+        self.stats.evictions = self._memory.stats.evictions
+        return found
+
+    def put_many(self, embeddings: Mapping[str, Embedding]) -> None:
+        encoded = {key: _encode_embedding(value) for key, value in embeddings.items()}
+        for key, blob in encoded.items():
+            self._memory.put(key, blob, len(blob))
+        if self._disk is not None and encoded:
+            self._disk.put_many(encoded)
+
+    def clear(self) -> None:
+        """Drop the in-memory tier; the persistent tier is left untouched."""
+        self._memory.clear()
+
+    def close(self) -> None:
+        if self._disk is not None:
+            self._disk.close()
+
+
+class SearchResultCache:
+    """TTL cache of ``IndexClient`` search responses.
+
+    Entries are keyed by the API name, a canonical hash of the merged request payload
+    (index identifiers included) and the collection's write generation. Any
+    ``upsert``/``update``/``delete`` issued through a ``CollectionClient`` of the same
+    ``VikingDB`` client bumps that generation, so results cached before the write are
+    never served afterwards. Cached responses are shared; treat them as read-only.
+    """
+
+    def __init__(self, *, ttl: float = 5.0, max_entries: int = 1024) -> None:
+        self._store: _LRUStore[SearchResponse] = _LRUStore(max_entries=max_entries, ttl=ttl)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._store.stats
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    @staticmethod
+    def key(api: str, generation: int, payload: Mapping[str, Any]) -> str:
+        material = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+        digest = hashlib.sha256(material.encode("utf-8")).hexdigest()
+        return f"{api}:{generation}:{digest}"
+
+    def get(self, key: str) -> Optional[SearchResponse]:
+        return self._store.get(key)
+
+    def put(self, key: str, response: SearchResponse) -> None:
+        self._store.put(key, response)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+
+class _VectorBucket:
+    """Ring buffer of unit-normalised query vectors sharing one search context."""
+
+    __slots__ = ("matrix", "expires", "responses", "size", "cursor")
+
+    def __init__(self, np: Any, capacity: int, dim: int) -> None:
+        self.matrix = np.zeros((capacity, dim), dtype=np.float32)
+        self.expires = np.zeros(capacity, dtype=np.float64)
+        self.responses: List[Optional[SearchResponse]] = [None] * capacity
+        self.size = 0
+        self.cursor = 0
+
+
+class SemanticQueryCache:
+    """Approximate cache reusing results for near-duplicate query vectors.
+
+    Cached queries are grouped by search context: every request field other than
+    ``dense_vector`` (filter, partition, limit, output_fields, ...) plus the index
+    identifiers and the collection write generation must match exactly. Within a
+    context the cached vectors live in one float32 matrix, so the nearest neighbour
+    of a new query is found with a single matrix-vector product; its response is
+    reused when the cosine similarity reaches ``threshold``. Requires ``numpy``.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.99,
+        max_entries: int = 256,
+        max_contexts: int = 64,
+        ttl: Optional[float] = None,
+    ) -> None:
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        if max_entries <= 0 or max_contexts <= 0:
+            raise ValueError("max_entries and max_contexts must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self._np = require_numpy()
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._max_contexts = max_contexts
+        self._ttl = ttl
+        self._buckets: "OrderedDict[str, _VectorBucket]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    @staticmethod
+    def context_key(api: str, generation: int, payload: Mapping[str, Any]) -> str:
+        """Return the exact-match part of the key (everything but ``dense_vector``)."""
+        context = {key: value for key, value in payload.items() if key != "dense_vector"}
+        return SearchResultCache.key(api, generation, context)
+
+    def _normalise(self, vector: Sequence[float]) -> Any:
+        np = self._np
+        query = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(query))
+        return query / norm if norm > 0 else None
+
+    def get(self, context: str, vector: Sequence[float]) -> Optional[SearchResponse]:
+        query = self._normalise(vector)
+        with self._lock:
+            bucket = self._buckets.get(context)
+            if query is None or bucket is None or bucket.size == 0 or bucket.matrix.shape[1] != query.shape[0]:
+                self.stats.misses += 1
+                return None
+            self._buckets.move_to_end(context)
+            scores = bucket.matrix[: bucket.size] @ query
+            if self._ttl is not None:
+                scores[bucket.expires[: bucket.size] <= time.monotonic()] = -2.0
+            best = int(scores.argmax())
+            if scores[best] < self._threshold:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            return bucket.responses[best]
+
+    def put(self, context: str, vector: Sequence[float], response: SearchResponse) -> None:
+        query = self._normalise(vector)
+        if query is None:
+            return
+        with self._lock:
+            bucket = self._buckets.get(context)
+            if bucket is None or bucket.matrix.shape[1] != query.shape[0]:
+                bucket = _VectorBucket(self._np, self._max_entries, query.shape[0])
+                self._buckets[context] = bucket
+                while len(self._buckets) > self._max_contexts:
+                    self._buckets.popitem(last=False)
+                    self.stats.evictions += 1
+            self._buckets.move_to_end(context)
+            slot = bucket.cursor
+            if bucket.size == self._max_entries:
+                self.stats.evictions += 1
+            bucket.matrix[slot] = query
+            bucket.expires[slot] = time.monotonic() + self._ttl if self._ttl is not None else 0.0
+            bucket.responses[slot] = response
+            bucket.cursor = (slot + 1) % self._max_entries
+            bucket.size = min(bucket.size + 1, self._max_entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class ItemCache:
+    """Read-through cache of ``CollectionClient.fetch`` items keyed by primary key.
+
+    ``fetch`` serves cached ids locally and only requests the missing ones. Writes
+    issued through the same ``CollectionClient`` keep it consistent: ``upsert`` and
+    ``update`` invalidate the written ids (read from ``primary_key`` in each row),
+    ``delete`` invalidates the deleted ids and ``delete_all`` clears the cache. Rows
+    without a primary key clear the whole cache. Entries also expire after ``ttl``
+    seconds, and the in-memory footprint is bounded by ``max_bytes``.
+
+    Keys are scoped by collection, so one cache may be shared by several
+    ``CollectionClient`` instances as long as they use the same ``primary_key``
+    field; a ``delete_all`` through any of them clears the whole cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl: Optional[float] = 60.0,
+        primary_key: str = "id",
+    ) -> None:
+        self._store: _LRUStore[DataItem] = _LRUStore(max_bytes=max_bytes, ttl=ttl)
+        self._primary_key = primary_key
+        self._variants: Set[Tuple[Tuple[str, ...], Tuple[Any, ...]]] = set()
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._store.stats
+
+    @property
+    def primary_key(self) -> str:
+        return self._primary_key
+
+    @property
+    def epoch(self) -> int:
+        """Counter bumped by every invalidation; used to drop racing fills."""
+        return self._epoch
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    @staticmethod
+    def key(scope: Tuple[str, ...], id: Any, variant: Tuple[Any, ...] = ()) -> Tuple[Any, ...]:
+        """Key of ``id`` in the collection identified by ``scope``."""
+        return (scope, str(id)) + variant
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[DataItem]:
+        return self._store.get(key)
+
+    def put_many(self, items: Mapping[Tuple[Any, ...], DataItem], epoch: int) -> None:
+        """Store fetched items unless an invalidation happened since ``epoch``."""
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            for key, item in items.items():
+                self._variants.add((key[0], key[2:]))
+                self._store.put(key, item, len(item.model_dump_json(by_alias=True)))
+
+    def invalidate(self, scope: Tuple[str, ...], ids: Sequence[Any]) -> None:
+        with self._lock:
+            self._epoch += 1
+            variants = [variant for owner, variant in self._variants if owner == scope]
+            for id in ids:
+                for variant in variants:
+                    self._store.pop(self.key(scope, id, variant))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._store.clear()
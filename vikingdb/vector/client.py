@@ -3,17 +3,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
 import time
 import warnings
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, Iterable, Optional, Sequence, Tuple, Union
 
+from pydantic import ValidationError
 from volcengine.ApiInfo import ApiInfo
 
 from .._client import Client, _REQUEST_ID_HEADER
-from ..auth import Auth
+from .._payload import encode_json_bytes, iter_json_chunks
+from ..auth import IAM, Auth
 from ..exceptions import VikingException
+from ..offload import DecodeOffload
 from .exceptions import VikingVectorException, VikingConnectionException
 from ..request_options import RequestOptions, ensure_request_options
 from ..version import __version__
@@ -31,12 +36,15 @@ except ImportError:  # pragma: no cover - fallback for older Python versions
             return _decorator
 
 if TYPE_CHECKING:
+    from .cache import EmbeddingCache, ItemCache, SearchResultCache, SemanticQueryCache
     from .collection import CollectionClient
     from .embedding import EmbeddingClient
     from .rerank import RerankClient
     from .index import IndexClient
 
 _DEFAULT_USER_AGENT = f"vikingdb-python-sdk/{__version__}"
+_INITIAL_RETRY_DELAY_SECONDS = 0.5
+_MAX_RETRY_DELAY_SECONDS = 8.0
 
 API_VECTOR_DATA_UPSERT = "VectorDataUpsert"
 API_VECTOR_DATA_UPDATE = "VectorDataUpdate"
@@ -54,9 +62,32 @@ API_VECTOR_EMBEDDING = "VectorEmbedding"
 API_VECTOR_RERANK = "VectorRerank"
 
 
+def _retry_delay(attempt: int) -> float:
+    return min(
+        _INITIAL_RETRY_DELAY_SECONDS * (2 ** (attempt - 1)),
+        _MAX_RETRY_DELAY_SECONDS,
+    )
+
+
 class VikingDB(Client):
     """Unified Vector client combining service and convenience helpers."""
 
+    _idempotent_apis = frozenset(
+        {
+            API_VECTOR_DATA_FETCH_IN_COLLECTION,
+            API_VECTOR_DATA_FETCH_IN_INDEX,
+            API_VECTOR_SEARCH_BY_VECTOR,
+            API_VECTOR_SEARCH_BY_MULTI_MODAL,
+            API_VECTOR_SEARCH_BY_ID,
+            API_VECTOR_SEARCH_BY_SCALAR,
+            API_VECTOR_SEARCH_BY_KEYWORDS,
+            API_VECTOR_SEARCH_BY_RANDOM,
+            API_VECTOR_DATA_AGGREGATE,
+            API_VECTOR_EMBEDDING,
+            API_VECTOR_RERANK,
+        }
+    )
+
     def __init__(
         self,
         *,
@@ -66,6 +97,8 @@ class VikingDB(Client):
         scheme: str = "https",
         sts_token: str = "",
         timeout: int = 30,
+        singleflight: bool = False,
+        decode_offload: Optional[DecodeOffload] = None,
     ) -> None:
         if auth is None:
             raise ValueError("auth is required for VikingDB")
@@ -78,7 +111,11 @@ class VikingDB(Client):
             sts_token=sts_token,
             scheme=scheme,
             timeout=timeout,
+            singleflight=singleflight,
+            decode_offload=decode_offload,
         )
+        self._generation_lock = threading.Lock()
+        self._collection_generations: Dict[Tuple[str, str, str], int] = {}
         try:
             resp = self.session.get(f"{scheme}://{host}/api/vikingdb/Ping")
             if resp.status_code != 200:
@@ -92,6 +129,7 @@ class VikingDB(Client):
         resource_id: Optional[str] = None,
         collection_name: Optional[str] = None,
         project_name: Optional[str] = None,
+        item_cache: Optional["ItemCache"] = None,
     ) -> "CollectionClient":
         from .collection import CollectionClient
 
@@ -100,7 +138,7 @@ class VikingDB(Client):
             collection_name=collection_name,
             project_name=project_name,
         )
-        return CollectionClient(self, meta)
+        return CollectionClient(self, meta, item_cache=item_cache)
 
     def index(
         self,
@@ -109,6 +147,8 @@ class VikingDB(Client):
         collection_name: Optional[str] = None,
         project_name: Optional[str] = None,
         index_name: Optional[str] = None,
+        result_cache: Optional["SearchResultCache"] = None,
+        semantic_cache: Optional["SemanticQueryCache"] = None,
     ) -> "IndexClient":
         from .index import IndexClient
 
@@ -118,18 +158,31 @@ class VikingDB(Client):
             project_name=project_name,
             index_name=index_name,
         )
-        return IndexClient(self, meta)
+        return IndexClient(self, meta, result_cache=result_cache, semantic_cache=semantic_cache)
 
-    def embedding(self) -> "EmbeddingClient":
+    def embedding(self, *, cache: Optional["EmbeddingCache"] = None) -> "EmbeddingClient":
         from .embedding import EmbeddingClient
 
-        return EmbeddingClient(self)
+        return EmbeddingClient(self, cache=cache)
 
     def rerank(self) -> "RerankClient":
         from .rerank import RerankClient
 
         return RerankClient(self)
 
+    @staticmethod
+    def _collection_key(meta: CollectionMeta) -> Tuple[str, str, str]:
+        return (meta.resource_id or "", meta.project_name or "", meta.collection_name or "")
+
+    def _collection_generation(self, meta: CollectionMeta) -> int:
+        """Return the write generation of the collection identified by ``meta``."""
+        return self._collection_generations.get(self._collection_key(meta), 0)
+
+    def _bump_collection_generation(self, meta: CollectionMeta) -> None:
+        key = self._collection_key(meta)
+        with self._generation_lock:
+            self._collection_generations[key] = self._collection_generations.get(key, 0) + 1
+
     def request(
         self,
         api: str,
@@ -137,46 +190,157 @@ class VikingDB(Client):
         *,
         options: Optional[RequestOptions] = None,
     ) -> Mapping[str, object]:
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        return self.request_body(api, body, options=options)
+
+    def request_stream(
+        self,
+        api: str,
+        payload: Mapping[str, object],
+        *,
+        rows_key: str = "data",
+        options: Optional[RequestOptions] = None,
+    ) -> Mapping[str, object]:
+        """Like :meth:`request`, but encode ``payload[rows_key]`` one row at a time.
+
+        IAM signs a hash of the body, so it is encoded into a single bytes buffer
+        without an intermediate ``str``; other auth providers stream it with chunked
+        transfer encoding while the rows are being encoded.
+        """
+        if isinstance(self.auth_provider, IAM):
+            return self.request_body(api, encode_json_bytes(payload, rows_key), options=options)
+        return self.request_body(api, lambda: iter_json_chunks(payload, rows_key), options=options)
+
+    def request_body(
+        self,
+        api: str,
+        body: Union[str, bytes, Callable[[], Iterable[bytes]]],
+        *,
+        options: Optional[RequestOptions] = None,
+    ) -> Mapping[str, object]:
+        """Send an already serialized JSON ``body`` with the retry policy of :meth:`request`.
+
+        ``body`` may also be a factory returning an iterable of byte chunks; it is
+        called once per attempt so retries resend the whole body.
+        """
         request_options = ensure_request_options(options)
-        max_attempts = (
-            request_options.max_attempts
-            if request_options.max_attempts and request_options.max_attempts > 0
-            else 3
-        )
-        initial_delay_seconds = 0.5
-        max_delay_seconds = 8.0
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "User-Agent": _DEFAULT_USER_AGENT,
-        }
-        if request_options.headers:
-            headers.update(request_options.headers)
-        if request_options.request_id:
-            headers[_REQUEST_ID_HEADER] = request_options.request_id
+        max_attempts, headers, params = self._request_settings(request_options)
+        for attempt in range(1, max_attempts + 1):
+            try:
+                response_data = self.json_exception(
+                    api,
+                    params,
+                    body() if callable(body) else body,
+                    headers=headers,
+                    timeout=request_options.timeout,
+                )
+                if not response_data:
+                    return {}
+                return response_data
+            except Exception:
+                if attempt >= max_attempts:
+                    raise
+                time.sleep(_retry_delay(attempt))
 
+    def request_items(
+        self,
+        api: str,
+        payload: Mapping[str, object],
+        path: Sequence[str],
+        *,
+        options: Optional[RequestOptions] = None,
+    ) -> Generator[Any, None, Any]:
+        """Send ``payload`` and yield the elements of the response array at ``path`` as they arrive.
+
+        The response is parsed incrementally, so memory stays bounded by one element.
+        No retries are attempted: elements may already have been consumed when a
+        failure surfaces. The remaining response fields are the generator's return
+        value.
+        """
+        request_options = ensure_request_options(options)
+        _, headers, params = self._request_settings(request_options)
         body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
-        params = dict(request_options.query) if request_options.query else None
+        try:
+            return (
+                yield from self._stream_json_array(
+                    api,
+                    params,
+                    body,
+                    path,
+                    headers=headers,
+                    timeout=request_options.timeout,
+                )
+            )
+        except VikingException as exc:
+            raise exc.promote(VikingVectorException) from None
+
+    async def async_request(
+        self,
+        api: str,
+        payload: Mapping[str, object],
+        *,
+        options: Optional[RequestOptions] = None,
+        parse: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """Asynchronous counterpart of :meth:`request` sharing its retry policy.
+
+        ``parse`` (typically ``Model.model_validate``) is applied to a non-empty
+        response, in the executor when ``decode_offload`` deems it large.
+        """
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        return await self.async_request_body(api, body, options=options, parse=parse)
+
+    async def async_request_body(
+        self,
+        api: str,
+        body: str,
+        *,
+        options: Optional[RequestOptions] = None,
+        parse: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """Asynchronous counterpart of :meth:`request_body`."""
+        request_options = ensure_request_options(options)
+        max_attempts, headers, params = self._request_settings(request_options)
         for attempt in range(1, max_attempts + 1):
             try:
-                response_data = self.json_exception(
+                response_data = await self.async_json_exception(
                     api,
                     params,
                     body,
                     headers=headers,
                     timeout=request_options.timeout,
+                    parse=parse,
                 )
                 if not response_data:
                     return {}
                 return response_data
+            except ValidationError:
+                raise
             except Exception:
                 if attempt >= max_attempts:
                     raise
-                delay = min(
-                    initial_delay_seconds * (2 ** (attempt - 1)),
-                    max_delay_seconds,
-                )
-                time.sleep(delay)
+                await asyncio.sleep(_retry_delay(attempt))
+
+    @staticmethod
+    def _request_settings(
+        request_options: RequestOptions,
+    ) -> Tuple[int, Dict[str, str], Optional[Dict[str, str]]]:
+        max_attempts = (
+            request_options.max_attempts
+            if request_options.max_attempts and request_options.max_attempts > 0
+            else 3
+        )
+        headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "User-Agent": _DEFAULT_USER_AGENT,
+        }
+        if request_options.headers:
+            headers.update(request_options.headers)
+        if request_options.request_id:
+            headers[_REQUEST_ID_HEADER] = request_options.request_id
+        params = dict(request_options.query) if request_options.query else None
+        return max_attempts, headers, params
 
     def json_exception(
         self,
@@ -200,6 +364,29 @@ class VikingDB(Client):
             ) from None
         return response
 
+    async def async_json_exception(
+        self,
+        api: str,
+        params: Optional[Mapping[str, Any]],
+        body: Any,
+        headers: Optional[Mapping[str, str]] = None,
+        *,
+        timeout: Optional[int] = None,
+        parse: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """Asynchronously send JSON request and raise structured vector exceptions on failure."""
+        try:
+            response = await self.async_json(api, params, body, headers=headers, timeout=timeout, parse=parse)
+        except VikingException as exc:
+            raise exc.promote(VikingVectorException) from None
+        if response is None:
+            raise VikingVectorException(
+                "InternalServerError",
+                "unknown",
+                f"empty response received for api {api}",
+            ) from None
+        return response
+
     def _build_api_info(self):
         header = {"Accept": "application/json"}
         return {
@@ -317,6 +504,8 @@ class VikingVector(VikingDB):
         scheme: str = "https",
         sts_token: str = "",
         timeout: int = 30,
+        singleflight: bool = False,
+        decode_offload: Optional[DecodeOffload] = None,
     ) -> None:
         warnings.warn(
             "VikingVector is deprecated; use VikingDB instead.",
@@ -330,4 +519,6 @@ class VikingVector(VikingDB):
             scheme=scheme,
             sts_token=sts_token,
             timeout=timeout,
+            singleflight=singleflight,
+            decode_offload=decode_offload,
         )
@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Mapping, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Tuple, Type, Union, cast
+
+from pydantic import BaseModel
 
 from .client import (
     API_VECTOR_DATA_DELETE,
@@ -13,10 +15,12 @@ from .client import (
 )
 from .models import (
     CollectionMeta,
+    DataItem,
     DeleteDataRequest,
     DeleteDataResponse,
     FetchDataInCollectionRequest,
     FetchDataInCollectionResponse,
+    FetchDataInCollectionResult,
     UpsertDataRequest,
     UpsertDataResponse,
     UpdateDataRequest,
@@ -24,6 +28,7 @@ from .models import (
 )
 from ..request_options import RequestOptions
 from .base import VectorClientBase
+from .cache import ItemCache
 
 if TYPE_CHECKING:
     from .client import VikingDB
@@ -32,45 +37,72 @@ if TYPE_CHECKING:
 class CollectionClient(VectorClientBase):
     """Client for collection-scoped VikingDB data operations."""
 
-    def __init__(self, service: "VikingDB", meta: CollectionMeta) -> None:
+    def __init__(
+        self,
+        service: "VikingDB",
+        meta: CollectionMeta,
+        *,
+        item_cache: Optional[ItemCache] = None,
+    ) -> None:
         super().__init__(service)
         self._meta = meta
         self._meta_payload = meta.model_dump(by_alias=True, exclude_none=True)
+        self._item_cache = item_cache
+        self._cache_scope = (meta.resource_id or "", meta.project_name or "", meta.collection_name or "")
+
+    @property
+    def item_cache(self) -> Optional[ItemCache]:
+        return self._item_cache
 
     def upsert(
         self,
         request: Union[UpsertDataRequest, Mapping[str, object]],
         *,
+        stream_body: bool = False,
         request_options: Optional[RequestOptions] = None,
     ) -> UpsertDataResponse:
+        """Write rows; with ``stream_body`` the ``data`` rows are encoded incrementally.
+
+        Streaming avoids holding the whole body as both ``str`` and ``bytes``, which
+        matters for large batches; see :meth:`VikingDB.request_stream`.
+        """
         payload = self._merge_payload(self._meta_payload, request)
-        response = cast(
-            UpsertDataResponse,
-            self._post(
-                API_VECTOR_DATA_UPSERT,
-                payload,
+        try:
+            response = cast(
                 UpsertDataResponse,
-                request_options=request_options,
-            ),
-        )
+                self._write(
+                    API_VECTOR_DATA_UPSERT,
+                    payload,
+                    UpsertDataResponse,
+                    stream_body,
+                    request_options,
+                ),
+            )
+        finally:
+            self._after_write(payload)
         return response
 
     def update(
         self,
         request: Union[UpdateDataRequest, Mapping[str, object]],
         *,
+        stream_body: bool = False,
         request_options: Optional[RequestOptions] = None,
     ) -> UpdateDataResponse:
         payload = self._merge_payload(self._meta_payload, request)
-        response = cast(
-            UpdateDataResponse,
-            self._post(
-                API_VECTOR_DATA_UPDATE,
-                payload,
+        try:
+            response = cast(
                 UpdateDataResponse,
-                request_options=request_options,
-            ),
-        )
+                self._write(
+                    API_VECTOR_DATA_UPDATE,
+                    payload,
+                    UpdateDataResponse,
+                    stream_body,
+                    request_options,
+                ),
+            )
+        finally:
+            self._after_write(payload)
         return response
 
     def delete(
@@ -80,31 +112,159 @@ class CollectionClient(VectorClientBase):
         request_options: Optional[RequestOptions] = None,
     ) -> DeleteDataResponse:
         payload = self._merge_payload(self._meta_payload, request)
+        try:
+            response = cast(
+                DeleteDataResponse,
+                self._post(
+                    API_VECTOR_DATA_DELETE,
+                    payload,
+                    DeleteDataResponse,
+                    request_options=request_options,
+                ),
+            )
+        finally:
+            self._after_write(payload)
+        return response
+
+    def fetch(
+        self,
+        request: Union[FetchDataInCollectionRequest, Mapping[str, object]],
+        *,
+        request_options: Optional[RequestOptions] = None,
+    ) -> FetchDataInCollectionResponse:
+        payload = self._merge_payload(self._meta_payload, request)
+        plan = self._fetch_plan(payload)
+        if plan is not None and not plan[2]:
+            return self._fetch_merge(payload, plan, None)
         response = cast(
-            DeleteDataResponse,
+            FetchDataInCollectionResponse,
             self._post(
-                API_VECTOR_DATA_DELETE,
-                payload,
-                DeleteDataResponse,
+                API_VECTOR_DATA_FETCH_IN_COLLECTION,
+                dict(payload, ids=plan[2]) if plan is not None else payload,
+                FetchDataInCollectionResponse,
                 request_options=request_options,
             ),
         )
+        if plan is not None:
+            return self._fetch_merge(payload, plan, response)
         return response
 
-    def fetch(
+    async def async_fetch(
         self,
         request: Union[FetchDataInCollectionRequest, Mapping[str, object]],
         *,
         request_options: Optional[RequestOptions] = None,
     ) -> FetchDataInCollectionResponse:
         payload = self._merge_payload(self._meta_payload, request)
+        plan = self._fetch_plan(payload)
+        if plan is not None and not plan[2]:
+            return self._fetch_merge(payload, plan, None)
         response = cast(
             FetchDataInCollectionResponse,
-            self._post(
+            await self._async_post(
                 API_VECTOR_DATA_FETCH_IN_COLLECTION,
-                payload,
+                dict(payload, ids=plan[2]) if plan is not None else payload,
                 FetchDataInCollectionResponse,
                 request_options=request_options,
             ),
         )
+        if plan is not None:
+            return self._fetch_merge(payload, plan, response)
         return response
+
+    def stream_fetch(
+        self,
+        request: Union[FetchDataInCollectionRequest, Mapping[str, object]],
+        *,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Iterator[DataItem]:
+        """Fetch rows and yield them while the response is still being read.
+
+        Each row is decoded and validated as soon as it arrives, so large fetches
+        never hold the whole response. Bypasses the item cache and does not retry.
+        """
+        payload = self._merge_payload(self._meta_payload, request)
+        for row in self._service.request_items(
+            API_VECTOR_DATA_FETCH_IN_COLLECTION,
+            payload,
+            ("result", "fetch"),
+            options=request_options,
+        ):
+            yield DataItem.model_validate(row)
+
+    def _write(
+        self,
+        api: str,
+        payload: Mapping[str, Any],
+        response_model: Type[BaseModel],
+        stream_body: bool,
+        request_options: Optional[RequestOptions],
+    ) -> BaseModel:
+        if not stream_body:
+            return self._post(api, payload, response_model, request_options=request_options)
+        response_payload = self._service.request_stream(api, payload, options=request_options)
+        return response_model.model_validate(response_payload)
+
+    def _after_write(self, payload: Mapping[str, Any]) -> None:
+        self._service._bump_collection_generation(self._meta)
+        cache = self._item_cache
+        if cache is None:
+            return
+        if payload.get("del_all"):
+            cache.clear()
+            return
+        if "data" in payload:
+            rows = cast(List[Mapping[str, Any]], payload.get("data") or [])
+            ids = [row.get(cache.primary_key) for row in rows]
+            if any(id is None for id in ids):
+                cache.clear()
+                return
+        else:
+            ids = list(cast(List[Any], payload.get("ids") or []))
+        cache.invalidate(self._cache_scope, ids)
+
+    def _fetch_plan(
+        self,
+        payload: Mapping[str, Any],
+    ) -> Optional[Tuple[int, Dict[str, Any], List[Any]]]:
+        """Return ``(epoch, cached items by id, ids still to fetch)`` when caching applies."""
+        cache = self._item_cache
+        if cache is None:
+            return None
+        variant = (payload.get("return_download_url"), payload.get("return_analyzed_result"))
+        epoch = cache.epoch
+        found: Dict[str, Any] = {}
+        missing: List[Any] = []
+        for id in dict.fromkeys(cast(List[Any], payload.get("ids") or [])):
+            item = cache.get(cache.key(self._cache_scope, id, variant))
+            if item is None:
+                missing.append(id)
+            else:
+                found[str(id)] = item
+        return epoch, found, missing
+
+    def _fetch_merge(
+        self,
+        payload: Mapping[str, Any],
+        plan: Tuple[int, Dict[str, Any], List[Any]],
+        response: Optional[FetchDataInCollectionResponse],
+    ) -> FetchDataInCollectionResponse:
+        cache = cast(ItemCache, self._item_cache)
+        epoch, found, _ = plan
+        ids_not_exist: List[Any] = []
+        if response is not None:
+            variant = (payload.get("return_download_url"), payload.get("return_analyzed_result"))
+            fetched = response.result.items if response.result else []
+            cache.put_many({cache.key(self._cache_scope, item.id, variant): item for item in fetched}, epoch)
+            found = dict(found)
+            found.update((str(item.id), item) for item in fetched)
+            ids_not_exist = list(response.result.ids_not_exist) if response.result else []
+            merged = response.model_copy()
+        else:
+            merged = FetchDataInCollectionResponse(api=API_VECTOR_DATA_FETCH_IN_COLLECTION)
+        ordered = dict.fromkeys(str(id) for id in cast(List[Any], payload.get("ids") or []))
+        merged.result = FetchDataInCollectionResult(
+            items=[found[id] for id in ordered if id in found],
+            ids_not_exist=ids_not_exist,
+        )
+        return merged
@@ -3,17 +3,32 @@
 
 from __future__ import annotations
 
-from typing import Mapping, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, Union, cast
 
 from ..request_options import RequestOptions
 from .base import VectorClientBase
 from .client import API_VECTOR_EMBEDDING
-from .models import EmbeddingRequest, EmbeddingResponse
+from .exceptions import VikingVectorException
+from .models import Embedding, EmbeddingRequest, EmbeddingResponse, EmbeddingResult
+
+if TYPE_CHECKING:
+    from .cache import EmbeddingCache
+    from .client import VikingDB
+
+_CACHED_MODEL_FIELDS = ("dense_model", "sparse_model")
 
 
 class EmbeddingClient(VectorClientBase):
     """Client for VikingDB embedding APIs."""
 
+    def __init__(self, service: "VikingDB", cache: Optional["EmbeddingCache"] = None) -> None:
+        super().__init__(service)
+        self._cache = cache
+
+    @property
+    def cache(self) -> Optional["EmbeddingCache"]:
+        return self._cache
+
     def embedding(
         self,
         request: Union[EmbeddingRequest, Mapping[str, object]],
@@ -21,6 +36,12 @@ class EmbeddingClient(VectorClientBase):
         request_options: Optional[RequestOptions] = None,
     ) -> EmbeddingResponse:
         payload = self._merge_payload({}, request)
+        plan = self._cache_plan(payload)
+        if plan is not None:
+            keys, cached, miss_payload = plan
+            if miss_payload is None:
+                return self._cached_response(keys, cached, None)
+            payload = miss_payload
         response = cast(
             EmbeddingResponse,
             self._post(
@@ -30,4 +51,88 @@ class EmbeddingClient(VectorClientBase):
                 request_options=request_options,
             ),
         )
+        if plan is not None:
+            return self._cached_response(plan[0], plan[1], response)
         return response
+
+    async def async_embedding(
+        self,
+        request: Union[EmbeddingRequest, Mapping[str, object]],
+        *,
+        request_options: Optional[RequestOptions] = None,
+    ) -> EmbeddingResponse:
+        payload = self._merge_payload({}, request)
+        plan = self._cache_plan(payload)
+        if plan is not None:
+            keys, cached, miss_payload = plan
+            if miss_payload is None:
+                return self._cached_response(keys, cached, None)
+            payload = miss_payload
+        response = cast(
+            EmbeddingResponse,
+            await self._async_post(
+                API_VECTOR_EMBEDDING,
+                payload,
+                EmbeddingResponse,
+                request_options=request_options,
+            ),
+        )
+        if plan is not None:
+            return self._cached_response(plan[0], plan[1], response)
+        return response
+
+    def _cache_plan(
+        self,
+        payload: Mapping[str, Any],
+    ) -> Optional[Tuple[List[str], Dict[str, Embedding], Optional[Dict[str, Any]]]]:
+        """Split ``payload`` into cached items and a request carrying only the misses.
+
+        Returns ``None`` when caching does not apply (no cache configured, or a tensor
+        model is requested, whose output is not cached).
+        """
+        if self._cache is None or payload.get("tensor_model") is not None:
+            return None
+        items = EmbeddingRequest.model_validate(payload).model_dump(by_alias=True, exclude_none=True)["data"]
+        models = {field: payload[field] for field in _CACHED_MODEL_FIELDS if payload.get(field) is not None}
+        keys = [self._cache.key(item, models) for item in items]
+        cached = self._cache.get_many(keys)
+        misses: Dict[str, Any] = {}
+        for key, item in zip(keys, items):
+            if key not in cached and key not in misses:
+                misses[key] = item
+        if not misses:
+            return keys, cached, None
+        miss_payload = dict(payload)
+        miss_payload["data"] = list(misses.values())
+        return keys, cached, miss_payload
+
+    def _cached_response(
+        self,
+        keys: List[str],
+        cached: Dict[str, Embedding],
+        response: Optional[EmbeddingResponse],
+    ) -> EmbeddingResponse:
+        assert self._cache is not None
+        resolved = dict(cached)
+        token_usage: Dict[str, Any] = {}
+        if response is not None:
+            fresh_keys = [key for key in dict.fromkeys(keys) if key not in cached]
+            fresh = list(response.result.data) if response.result else []
+            if len(fresh) != len(fresh_keys):
+                raise VikingVectorException(
+                    "InternalServerError",
+                    response.request_id or "unknown",
+                    f"embedding returned {len(fresh)} results for {len(fresh_keys)} uncached inputs",
+                )
+            fresh_map = dict(zip(fresh_keys, fresh))
+            self._cache.put_many(fresh_map)
+            resolved.update(fresh_map)
+            token_usage = response.result.token_usage if response.result else {}
+            merged = response.model_copy()
+        else:
+            merged = EmbeddingResponse(api=API_VECTOR_EMBEDDING)
+        merged.result = EmbeddingResult(
+            data=[resolved[key] for key in keys],
+            token_usage=token_usage,
+        )
+        return merged
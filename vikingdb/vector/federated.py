@@ -0,0 +1,197 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Global top-k search across several indexes."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from ..request_options import RequestOptions
+from .base import VectorClientBase
+from .fusion import merge_top_k
+from .index import _search_api
+from .models import SearchByVectorRequest, SearchItemResult, SearchResponse
+
+if TYPE_CHECKING:
+    from .index import IndexClient
+
+__all__ = [
+    "FederatedHit",
+    "FederatedSearch",
+    "FederatedSearchResult",
+    "ShardResult",
+]
+
+
+@dataclass
+class ShardResult:
+    """Outcome of one shard's search within a federated query."""
+
+    name: str
+    latency_ms: float
+    response: Optional[SearchResponse] = None
+    error: Optional[Exception] = None
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.response is not None
+
+
+@dataclass
+class FederatedHit:
+    """A merged search hit together with the shard that returned it."""
+
+    shard: str
+    item: SearchItemResult
+
+
+@dataclass
+class FederatedSearchResult:
+    """Globally ranked hits; ``partial`` is set when any shard failed or timed out."""
+
+    data: List[FederatedHit] = field(default_factory=list)
+    partial: bool = False
+    shards: List[ShardResult] = field(default_factory=list)
+
+    @property
+    def latencies(self) -> Dict[str, float]:
+        """Per-shard latency in milliseconds, keyed by shard name."""
+        return {shard.name: shard.latency_ms for shard in self.shards}
+
+
+class FederatedSearch:
+    """Fan a search out to several ``IndexClient`` shards and merge a global top-k.
+
+    ``shards`` is a mapping of shard name to client, or a sequence (named by
+    position). Shards are queried concurrently; one that fails or does not answer
+    within ``timeout`` seconds is reported in ``shards`` and makes the result
+    ``partial`` instead of failing the whole query. If no shard answers, the first
+    error is raised. Scores must be comparable across shards (same metric).
+    """
+
+    def __init__(
+        self,
+        shards: Union[Mapping[str, "IndexClient"], Sequence["IndexClient"]],
+        *,
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        if isinstance(shards, Mapping):
+            self._shards: List[Tuple[str, "IndexClient"]] = [(str(name), client) for name, client in shards.items()]
+        else:
+            self._shards = [(str(position), client) for position, client in enumerate(shards)]
+        if not self._shards:
+            raise ValueError("at least one shard is required")
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        self._timeout = timeout
+        self._max_concurrency = max_concurrency or len(self._shards)
+
+    @property
+    def shard_names(self) -> List[str]:
+        return [name for name, _ in self._shards]
+
+    def search_by_vector(
+        self,
+        request: Union[SearchByVectorRequest, Mapping[str, object]],
+        *,
+        limit: Optional[int] = None,
+        dedupe: bool = False,
+        timeout: Optional[float] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> FederatedSearchResult:
+        return self.search(
+            "vector",
+            request,
+            limit=limit,
+            dedupe=dedupe,
+            timeout=timeout,
+            request_options=request_options,
+        )
+
+    def search(
+        self,
+        kind: str,
+        request: Any,
+        *,
+        limit: Optional[int] = None,
+        dedupe: bool = False,
+        timeout: Optional[float] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> FederatedSearchResult:
+        """Run the ``search_by_<kind>`` search on every shard and merge by score.
+
+        ``limit`` defaults to the request's own ``limit``; without either, all hits
+        are returned. With ``dedupe`` an id returned by several shards (e.g.
+        overlapping replicas) is kept once, from the shard that scored it highest.
+        ``timeout`` overrides the instance default for this call.
+        """
+        _search_api(kind)
+        if limit is None:
+            value = VectorClientBase._merge_payload({}, request).get("limit")
+            limit = int(value) if value is not None else None
+        budget = self._timeout if timeout is None else timeout
+
+        def run(name: str, client: "IndexClient") -> ShardResult:
+            started = time.perf_counter()
+            try:
+                response = getattr(client, f"search_by_{kind}")(request, request_options=request_options)
+            except Exception as exc:
+                return ShardResult(name=name, latency_ms=_since(started), error=exc)
+            return ShardResult(name=name, latency_ms=_since(started), response=response)
+
+        started = time.perf_counter()
+        executor = ThreadPoolExecutor(
+            max_workers=min(self._max_concurrency, len(self._shards)),
+            thread_name_prefix="vikingdb-federated",
+        )
+        try:
+            futures = [executor.submit(run, name, client) for name, client in self._shards]
+            wait(futures, timeout=budget)
+        finally:
+            # Do not block on shards that overran the budget; their threads finish on their own.
+            executor.shutdown(wait=False)
+        elapsed_ms = _since(started)
+
+        shards: List[ShardResult] = []
+        for (name, _), future in zip(self._shards, futures):
+            if not future.done():
+                future.cancel()
+                shards.append(ShardResult(name=name, latency_ms=elapsed_ms, timed_out=True))
+            else:
+                shards.append(future.result())
+
+        answered = [shard for shard in shards if shard.ok]
+        if not answered:
+            errors = [shard.error for shard in shards if shard.error is not None]
+            if errors:
+                raise errors[0]
+        ranked = [
+            [FederatedHit(shard.name, item) for item in _items(shard.response)]
+            for shard in answered
+        ]
+        merged = merge_top_k(ranked, limit=limit, dedupe=dedupe, item=_hit_item)
+        return FederatedSearchResult(
+            data=merged,
+            partial=len(answered) < len(shards),
+            shards=shards,
+        )
+
+
+def _items(response: Optional[SearchResponse]) -> List[SearchItemResult]:
+    if response is None or response.result is None:
+        return []
+    return list(response.result.data)
+
+
+def _hit_item(hit: FederatedHit) -> SearchItemResult:
+    return hit.item
+
+
+def _since(started: float) -> float:
+    return (time.perf_counter() - started) * 1000.0
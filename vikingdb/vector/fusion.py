@@ -0,0 +1,176 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Client-side fusion of ranked search results from several retrievers."""
+
+from __future__ import annotations
+
+import heapq
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, TypeVar
+
+from ._numpy import require_numpy
+from .models import SearchItemResult
+
+__all__ = [
+    "merge_top_k",
+    "reciprocal_rank_fusion",
+    "weighted_score_fusion",
+]
+
+_DEFAULT_RRF_K = 60
+
+T = TypeVar("T")
+
+
+def merge_top_k(
+    results: Iterable[Sequence[T]],
+    *,
+    limit: Optional[int] = None,
+    dedupe: bool = False,
+    item: Optional[Callable[[T], SearchItemResult]] = None,
+) -> List[T]:
+    """K-way merge result lists that are each sorted by descending score.
+
+    Uses a heap over the list heads, so only the first ``limit`` items are examined
+    beyond the heads. With ``dedupe`` an id seen earlier (i.e. with a higher score)
+    suppresses later occurrences. Items without a score sort last; ties keep the
+    order of ``results``. The lists may hold wrappers (e.g. hits tagged with their
+    source) when ``item`` extracts the ``SearchItemResult`` from each.
+    """
+    get = item if item is not None else _identity
+    merged: Iterable[T] = heapq.merge(*results, key=lambda entry: _sort_key(get(entry)))
+    if dedupe:
+        merged = _unique(merged, get)
+    return list(islice(merged, limit))
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _sort_key(item: SearchItemResult) -> float:
+    score = _item_score(item)
+    return -score if score is not None else float("inf")
+
+
+def _unique(entries: Iterable[T], get: Callable[[T], SearchItemResult]) -> Iterable[T]:
+    seen: Set[str] = set()
+    for entry in entries:
+        key = str(get(entry).id)
+        if key not in seen:
+            seen.add(key)
+            yield entry
+
+
+def reciprocal_rank_fusion(
+    sources: Mapping[str, Sequence[SearchItemResult]],
+    *,
+    k: int = _DEFAULT_RRF_K,
+    weights: Optional[Mapping[str, float]] = None,
+    limit: Optional[int] = None,
+) -> List[SearchItemResult]:
+    """Fuse ranked lists by summing ``weight / (k + rank)`` over the sources.
+
+    ``sources`` maps a source name to its results, best first. Items are matched by
+    ``id``; the returned items carry the fused value in ``score`` and each source's
+    original score in ``source_scores``.
+    """
+    np = require_numpy()
+    ids, items, ranks, scores = _align(np, sources)
+    weight = _weights(np, sources, weights)
+    present = ~np.isnan(ranks)
+    contribution = np.where(present, weight[:, None] / (k + np.where(present, ranks, 0.0)), 0.0)
+    return _fused(np, sources, ids, items, scores, contribution.sum(axis=0), limit)
+
+
+def weighted_score_fusion(
+    sources: Mapping[str, Sequence[SearchItemResult]],
+    *,
+    weights: Optional[Mapping[str, float]] = None,
+    limit: Optional[int] = None,
+) -> List[SearchItemResult]:
+    """Fuse results by a weighted sum of min-max normalised scores.
+
+    Each source's scores are scaled to ``[0, 1]`` before weighting, so retrievers
+    with different score ranges (e.g. cosine vs. BM25) can be combined. An item a
+    source did not return contributes ``0`` for that source.
+    """
+    np = require_numpy()
+    ids, items, _, scores = _align(np, sources)
+    weight = _weights(np, sources, weights)
+    present = ~np.isnan(scores)
+    low = np.where(present, scores, np.inf).min(axis=1, keepdims=True)
+    high = np.where(present, scores, -np.inf).max(axis=1, keepdims=True)
+    span = high - low
+    # A source whose items all share one score (or that returned none) ranks them equally.
+    flat = ~(span > 0)
+    normalised = np.where(present, (scores - np.where(flat, 0.0, low)) / np.where(flat, 1.0, span), 0.0)
+    normalised = np.where(flat & present, 1.0, normalised)
+    return _fused(np, sources, ids, items, scores, (weight[:, None] * normalised).sum(axis=0), limit)
+
+
+def _item_score(item: SearchItemResult) -> Optional[float]:
+    return item.score if item.score is not None else item.ann_score
+
+
+def _align(
+    np: Any,
+    sources: Mapping[str, Sequence[SearchItemResult]],
+) -> Tuple[List[str], Dict[str, SearchItemResult], Any, Any]:
+    """Return the id union plus ``(n_sources, n_ids)`` rank and score matrices (NaN when absent)."""
+    ids: Dict[str, int] = {}
+    items: Dict[str, SearchItemResult] = {}
+    for results in sources.values():
+        for item in results:
+            key = str(item.id)
+            if key not in ids:
+                ids[key] = len(ids)
+                items[key] = item
+    ranks = np.full((len(sources), len(ids)), np.nan)
+    scores = np.full((len(sources), len(ids)), np.nan)
+    for row, results in enumerate(sources.values()):
+        for rank, item in enumerate(results, start=1):
+            column = ids[str(item.id)]
+            if np.isnan(ranks[row, column]):
+                ranks[row, column] = rank
+                score = _item_score(item)
+                scores[row, column] = np.nan if score is None else score
+    return list(ids), items, ranks, scores
+
+
+def _weights(np: Any, sources: Mapping[str, Any], weights: Optional[Mapping[str, float]]) -> Any:
+    if weights is None:
+        return np.ones(len(sources))
+    unknown = set(weights) - set(sources)
+    if unknown:
+        raise ValueError(f"weights given for unknown sources: {sorted(unknown)}")
+    return np.array([float(weights.get(name, 1.0)) for name in sources])
+
+
+def _fused(
+    np: Any,
+    sources: Mapping[str, Any],
+    ids: List[str],
+    items: Dict[str, SearchItemResult],
+    scores: Any,
+    fused: Any,
+    limit: Optional[int],
+) -> List[SearchItemResult]:
+    order = np.argsort(-fused, kind="stable")
+    if limit is not None:
+        order = order[:limit]
+    names = list(sources)
+    results: List[SearchItemResult] = []
+    for column in order.tolist():
+        source_scores = {
+            names[row]: float(scores[row, column])
+            for row in range(len(names))
+            if not np.isnan(scores[row, column])
+        }
+        results.append(
+            items[ids[column]].model_copy(
+                update={"score": float(fused[column]), "source_scores": source_scores}
+            )
+        )
+    return results
@@ -3,10 +3,36 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Mapping, Optional, Union, cast
+import asyncio
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+from pydantic import BaseModel
+
+from .._concurrency import run_concurrently
 
 from ..request_options import RequestOptions
-from .base import VectorClientBase
+from .base import VectorClientBase, sum_token_usage
+from .cache import SearchResultCache, SemanticQueryCache
+from .fusion import merge_top_k, reciprocal_rank_fusion, weighted_score_fusion
+from .postprocess import maxsim_scores, mmr_select
+from .prepared import PreparedVectorSearch
 from .client import (
     API_VECTOR_DATA_AGGREGATE,
     API_VECTOR_DATA_FETCH_IN_INDEX,
@@ -22,6 +48,7 @@ from .models import (
     AggResponse,
     FetchDataInIndexRequest,
     FetchDataInIndexResponse,
+    IndexDataItem,
     IndexMeta,
     SearchByIDRequest,
     SearchByKeywordsRequest,
@@ -29,20 +56,89 @@ from .models import (
     SearchByRandomRequest,
     SearchByScalarRequest,
     SearchByVectorRequest,
+    SearchItemResult,
     SearchResponse,
+    SearchResult,
 )
 
 if TYPE_CHECKING:
     from .client import VikingDB
 
+_DEFAULT_BATCH_CONCURRENCY = 8
+_DEFAULT_PAGE_SIZE = 100
+
+_SEARCH_APIS = {
+    "vector": API_VECTOR_SEARCH_BY_VECTOR,
+    "multi_modal": API_VECTOR_SEARCH_BY_MULTI_MODAL,
+    "id": API_VECTOR_SEARCH_BY_ID,
+    "scalar": API_VECTOR_SEARCH_BY_SCALAR,
+    "keywords": API_VECTOR_SEARCH_BY_KEYWORDS,
+    "random": API_VECTOR_SEARCH_BY_RANDOM,
+}
+
+
+def _search_api(kind: str) -> str:
+    try:
+        return _SEARCH_APIS[kind]
+    except KeyError:
+        raise ValueError(
+            f"unsupported search kind {kind!r}; expected one of {sorted(_SEARCH_APIS)}"
+        ) from None
+
+
+_FUSION_METHODS = ("rrf", "weighted")
+
+
+def _ids_in_variants(payload: Mapping[str, Any], chunk_size: int) -> List[Dict[str, Any]]:
+    """Split ``advance.ids_in`` into ``chunk_size`` pieces; small or absent sets stay whole."""
+    if chunk_size <= 0:
+        raise ValueError("ids_in_chunk_size must be positive")
+    advance = cast(Mapping[str, Any], payload.get("advance") or {})
+    ids_in = list(cast(Sequence[Any], advance.get("ids_in") or []))
+    if len(ids_in) <= chunk_size:
+        return [{}]
+    return [
+        {"advance": dict(advance, ids_in=ids_in[start:start + chunk_size])}
+        for start in range(0, len(ids_in), chunk_size)
+    ]
+
+
+def _partition_variants(partitions: Sequence[str]) -> List[Dict[str, Any]]:
+    unique = list(dict.fromkeys(partitions))
+    if not unique:
+        raise ValueError("partitions must not be empty")
+    return [{"partition": partition} for partition in unique]
+
+
+def _plain_query(value: Any) -> Any:
+    to_list = getattr(value, "tolist", None)
+    return to_list() if callable(to_list) else value
+
 
 class IndexClient(VectorClientBase):
     """Client for index-scoped data operations."""
 
-    def __init__(self, service: "VikingDB", meta: IndexMeta) -> None:
+    def __init__(
+        self,
+        service: "VikingDB",
+        meta: IndexMeta,
+        *,
+        result_cache: Optional[SearchResultCache] = None,
+        semantic_cache: Optional[SemanticQueryCache] = None,
+    ) -> None:
         super().__init__(service)
         self._meta = meta
         self._meta_payload = meta.model_dump(by_alias=True, exclude_none=True)
+        self._result_cache = result_cache
+        self._semantic_cache = semantic_cache
+
+    @property
+    def result_cache(self) -> Optional[SearchResultCache]:
+        return self._result_cache
+
+    @property
+    def semantic_cache(self) -> Optional[SemanticQueryCache]:
+        return self._semantic_cache
 
     def fetch(
         self,
@@ -62,59 +158,117 @@ class IndexClient(VectorClientBase):
         )
         return response
 
-    def search_by_vector(
+    async def async_fetch(
         self,
-        request: Union[SearchByVectorRequest, Mapping[str, object]],
+        request: Union[FetchDataInIndexRequest, Mapping[str, object]],
         *,
         request_options: Optional[RequestOptions] = None,
-    ) -> SearchResponse:
+    ) -> FetchDataInIndexResponse:
         payload = self._merge_payload(self._meta_payload, request)
         response = cast(
-            SearchResponse,
-            self._post(
-                API_VECTOR_SEARCH_BY_VECTOR,
+            FetchDataInIndexResponse,
+            await self._async_post(
+                API_VECTOR_DATA_FETCH_IN_INDEX,
                 payload,
-                SearchResponse,
+                FetchDataInIndexResponse,
                 request_options=request_options,
             ),
         )
         return response
 
+    def search_by_vector(
+        self,
+        request: Union[SearchByVectorRequest, Mapping[str, object]],
+        *,
+        partitions: Optional[Sequence[str]] = None,
+        ids_in_chunk_size: Optional[int] = None,
+        max_concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
+        request_options: Optional[RequestOptions] = None,
+    ) -> SearchResponse:
+        """Search by dense/sparse vector.
+
+        With ``partitions`` one search runs per partition (at most ``max_concurrency``
+        in flight) and the results are merged into a single top-``limit`` by score,
+        keeping the best hit per id. With ``ids_in_chunk_size``, an ``advance.ids_in``
+        restriction larger than that is split into chunks searched the same way;
+        smaller sets go out as one request. The same applies to the other scored
+        searches.
+        """
+        payload = self._merge_payload(self._meta_payload, request)
+        return self._search_fanout(
+            self._search_vector, payload, partitions, ids_in_chunk_size, max_concurrency, request_options
+        )
+
+    def _search_vector(
+        self,
+        payload: Mapping[str, Any],
+        request_options: Optional[RequestOptions],
+    ) -> SearchResponse:
+        semantic_cache = self._semantic_cache
+        if semantic_cache is None or payload.get("dense_vector") is None:
+            return self._search(API_VECTOR_SEARCH_BY_VECTOR, payload, request_options)
+        context = semantic_cache.context_key(
+            API_VECTOR_SEARCH_BY_VECTOR,
+            self._service._collection_generation(self._meta),
+            payload,
+        )
+        vector = cast(Sequence[float], payload["dense_vector"])
+        cached = semantic_cache.get(context, vector)
+        if cached is not None:
+            return cached
+        response = self._search(API_VECTOR_SEARCH_BY_VECTOR, payload, request_options)
+        semantic_cache.put(context, vector, response)
+        return response
+
+    def prepare_search_by_vector(
+        self,
+        template: Union[Mapping[str, object], None] = None,
+    ) -> PreparedVectorSearch:
+        """Compile a vector search whose fields other than ``dense_vector`` never change.
+
+        ``template`` holds the static request fields (``filter``, ``limit``,
+        ``output_fields``, ``advance``, ...); pass the vector to
+        :meth:`PreparedVectorSearch.execute` on each call.
+        """
+        return PreparedVectorSearch(self._service, self._merge_payload(self._meta_payload, template))
+
     def search_by_multi_modal(
         self,
         request: Union[SearchByMultiModalRequest, Mapping[str, object]],
         *,
+        partitions: Optional[Sequence[str]] = None,
+        ids_in_chunk_size: Optional[int] = None,
+        max_concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
         request_options: Optional[RequestOptions] = None,
     ) -> SearchResponse:
         payload = self._merge_payload(self._meta_payload, request)
-        response = cast(
-            SearchResponse,
-            self._post(
-                API_VECTOR_SEARCH_BY_MULTI_MODAL,
-                payload,
-                SearchResponse,
-                request_options=request_options,
-            ),
+        return self._search_fanout(
+            functools.partial(self._search, API_VECTOR_SEARCH_BY_MULTI_MODAL),
+            payload,
+            partitions,
+            ids_in_chunk_size,
+            max_concurrency,
+            request_options,
         )
-        return response
 
     def search_by_id(
         self,
         request: Union[SearchByIDRequest, Mapping[str, object]],
         *,
+        partitions: Optional[Sequence[str]] = None,
+        ids_in_chunk_size: Optional[int] = None,
+        max_concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
         request_options: Optional[RequestOptions] = None,
     ) -> SearchResponse:
         payload = self._merge_payload(self._meta_payload, request)
-        response = cast(
-            SearchResponse,
-            self._post(
-                API_VECTOR_SEARCH_BY_ID,
-                payload,
-                SearchResponse,
-                request_options=request_options,
-            ),
+        return self._search_fanout(
+            functools.partial(self._search, API_VECTOR_SEARCH_BY_ID),
+            payload,
+            partitions,
+            ids_in_chunk_size,
+            max_concurrency,
+            request_options,
         )
-        return response
 
     def search_by_scalar(
         self,
@@ -123,34 +277,26 @@ class IndexClient(VectorClientBase):
         request_options: Optional[RequestOptions] = None,
     ) -> SearchResponse:
         payload = self._merge_payload(self._meta_payload, request)
-        response = cast(
-            SearchResponse,
-            self._post(
-                API_VECTOR_SEARCH_BY_SCALAR,
-                payload,
-                SearchResponse,
-                request_options=request_options,
-            ),
-        )
-        return response
+        return self._search(API_VECTOR_SEARCH_BY_SCALAR, payload, request_options)
 
     def search_by_keywords(
         self,
         request: Union[SearchByKeywordsRequest, Mapping[str, object]],
         *,
+        partitions: Optional[Sequence[str]] = None,
+        ids_in_chunk_size: Optional[int] = None,
+        max_concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
         request_options: Optional[RequestOptions] = None,
     ) -> SearchResponse:
         payload = self._merge_payload(self._meta_payload, request)
-        response = cast(
-            SearchResponse,
-            self._post(
-                API_VECTOR_SEARCH_BY_KEYWORDS,
-                payload,
-                SearchResponse,
-                request_options=request_options,
-            ),
+        return self._search_fanout(
+            functools.partial(self._search, API_VECTOR_SEARCH_BY_KEYWORDS),
+            payload,
+            partitions,
+            ids_in_chunk_size,
+            max_concurrency,
+            request_options,
         )
-        return response
 
     def search_by_random(
         self,
@@ -159,16 +305,7 @@ class IndexClient(VectorClientBase):
         request_options: Optional[RequestOptions] = None,
     ) -> SearchResponse:
         payload = self._merge_payload(self._meta_payload, request)
-        response = cast(
-            SearchResponse,
-            self._post(
-                API_VECTOR_SEARCH_BY_RANDOM,
-                payload,
-                SearchResponse,
-                request_options=request_options,
-            ),
-        )
-        return response
+        return self._search(API_VECTOR_SEARCH_BY_RANDOM, payload, request_options)
 
     def aggregate(
         self,
@@ -187,3 +324,574 @@ class IndexClient(VectorClientBase):
             ),
         )
         return response
+
+    def _search(
+        self,
+        api: str,
+        payload: Mapping[str, Any],
+        request_options: Optional[RequestOptions],
+    ) -> SearchResponse:
+        cache = self._result_cache
+        if cache is None:
+            return cast(SearchResponse, self._post(api, payload, SearchResponse, request_options=request_options))
+        key = cache.key(api, self._service._collection_generation(self._meta), payload)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        response = cast(SearchResponse, self._post(api, payload, SearchResponse, request_options=request_options))
+        cache.put(key, response)
+        return response
+
+    def _search_fanout(
+        self,
+        search: Callable[[Mapping[str, Any], Optional[RequestOptions]], SearchResponse],
+        payload: Mapping[str, Any],
+        partitions: Optional[Sequence[str]],
+        ids_in_chunk_size: Optional[int],
+        max_concurrency: int,
+        request_options: Optional[RequestOptions],
+    ) -> SearchResponse:
+        variants: List[Dict[str, Any]] = [{}]
+        if partitions is not None:
+            variants = _partition_variants(partitions)
+        if ids_in_chunk_size is not None:
+            variants = [
+                dict(variant, **chunk)
+                for variant in variants
+                for chunk in _ids_in_variants(payload, ids_in_chunk_size)
+            ]
+        if len(variants) == 1 and partitions is None:
+            return search(payload, request_options)
+        return self._search_scatter(search, payload, variants, max_concurrency, request_options)
+
+    def _search_scatter(
+        self,
+        search: Callable[[Mapping[str, Any], Optional[RequestOptions]], SearchResponse],
+        payload: Mapping[str, Any],
+        variants: Sequence[Mapping[str, Any]],
+        max_concurrency: int,
+        request_options: Optional[RequestOptions],
+    ) -> SearchResponse:
+        """Run ``search`` once per variant of ``payload`` and merge the top-k by score.
+
+        Each sub-search asks for ``offset + limit`` hits from the start so the global
+        window can be cut after merging; duplicate ids keep their best-scoring hit.
+        """
+        limit = cast(Optional[int], payload.get("limit"))
+        offset = cast(int, payload.get("offset") or 0)
+        base = dict(payload)
+        base.pop("offset", None)
+        if limit is not None:
+            base["limit"] = limit + offset
+        calls = [
+            functools.partial(search, dict(base, **variant), request_options)
+            for variant in variants
+        ]
+        responses = cast(List[SearchResponse], run_concurrently(calls, max_concurrency=max_concurrency))
+        results = [response.result for response in responses if response.result is not None]
+        merged_items = merge_top_k(
+            [result.data for result in results],
+            limit=None if limit is None else offset + limit,
+            dedupe=True,
+        )[offset:]
+        matched = [result.filter_matched_count for result in results]
+        token_usage = sum_token_usage(result.token_usage for result in results)
+        merged = responses[0].model_copy()
+        merged.result = (results[0] if results else SearchResult()).model_copy(
+            update={
+                "data": merged_items,
+                "total_return_count": len(merged_items),
+                "filter_matched_count": (
+                    sum(cast(List[int], matched)) if matched and None not in matched else None
+                ),
+                "token_usage": token_usage,
+            }
+        )
+        return merged
+
+    def search_hybrid(
+        self,
+        *,
+        vector: Union[SearchByVectorRequest, Mapping[str, object]],
+        keywords: Union[SearchByKeywordsRequest, Mapping[str, object]],
+        multi_modal: Union[SearchByMultiModalRequest, Mapping[str, object], None] = None,
+        fusion: str = "rrf",
+        weights: Optional[Mapping[str, float]] = None,
+        rrf_k: int = 60,
+        limit: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> SearchResponse:
+        """Run dense, keyword and (optionally) multi-modal searches concurrently and fuse them.
+
+        ``fusion`` is ``"rrf"`` (reciprocal rank fusion) or ``"weighted"`` (weighted sum
+        of min-max normalised scores); ``weights`` is keyed by ``"vector"``,
+        ``"keywords"`` and ``"multi_modal"``. Each fused item's ``score`` is the fused
+        value and ``source_scores`` keeps the score each search returned. Without
+        ``limit`` the largest ``limit`` of the sub-requests is used. Requires numpy.
+        """
+        if fusion not in _FUSION_METHODS:
+            raise ValueError(f"unsupported fusion {fusion!r}; expected one of {list(_FUSION_METHODS)}")
+        searches = [
+            ("vector", functools.partial(self.search_by_vector, vector, request_options=request_options)),
+            ("keywords", functools.partial(self.search_by_keywords, keywords, request_options=request_options)),
+        ]
+        if multi_modal is not None:
+            searches.append(
+                (
+                    "multi_modal",
+                    functools.partial(self.search_by_multi_modal, multi_modal, request_options=request_options),
+                )
+            )
+        responses = cast(
+            List[SearchResponse],
+            run_concurrently([call for _, call in searches], max_concurrency=len(searches)),
+        )
+        sources = {
+            name: (response.result.data if response.result else [])
+            for (name, _), response in zip(searches, responses)
+        }
+        if limit is None:
+            limits = [
+                self._merge_payload({}, request).get("limit")
+                for request in (vector, keywords, multi_modal)
+                if request is not None
+            ]
+            limit = max((cast(int, value) for value in limits if value is not None), default=None)
+        if fusion == "rrf":
+            fused = reciprocal_rank_fusion(sources, k=rrf_k, weights=weights, limit=limit)
+        else:
+            fused = weighted_score_fusion(sources, weights=weights, limit=limit)
+        token_usage = sum_token_usage(
+            response.result.token_usage for response in responses if response.result is not None
+        )
+        merged = responses[0].model_copy()
+        merged.result = SearchResult(data=fused, total_return_count=len(fused), token_usage=token_usage)
+        return merged
+
+    def search_by_vector_mmr(
+        self,
+        request: Union[SearchByVectorRequest, Mapping[str, object]],
+        *,
+        k: int,
+        lambda_mult: float = 0.5,
+        vector_field: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> SearchResponse:
+        """Search by vector, then diversify the candidates with maximal marginal relevance.
+
+        The request's ``limit`` sets the candidate pool; ``k`` of them are kept.
+        Candidate vectors are read from ``fields[vector_field]`` when the index
+        returns that field (it is added to ``output_fields`` for the search and
+        stripped again if it was not asked for). Candidates still lacking a vector
+        are fetched with one ``fetch`` call; ids the index cannot return are
+        dropped. Requires numpy.
+        """
+        payload = dict(self._merge_payload(self._meta_payload, request))
+        output_fields = cast(Optional[Sequence[str]], payload.get("output_fields"))
+        strip_field = vector_field is not None and output_fields is not None and vector_field not in output_fields
+        if strip_field:
+            payload["output_fields"] = list(cast(Sequence[str], output_fields)) + [cast(str, vector_field)]
+        response = self.search_by_vector(payload, request_options=request_options)
+        items = list(response.result.data) if response.result else []
+
+        vectors: Dict[str, Any] = {}
+        if vector_field is not None:
+            for item in items:
+                value = item.fields.get(vector_field)
+                if value is not None:
+                    vectors[str(item.id)] = value
+        missing = [item.id for item in items if str(item.id) not in vectors]
+        if missing:
+            fetch_payload: Dict[str, Any] = {"ids": missing}
+            if payload.get("partition") is not None:
+                fetch_payload["partition"] = payload["partition"]
+            fetched = self.fetch(fetch_payload, request_options=request_options)
+            for row in fetched.result.items if fetched.result else []:
+                if row.dense_vector is not None:
+                    vectors[str(row.id)] = row.dense_vector
+
+        candidates = [item for item in items if str(item.id) in vectors]
+        order = mmr_select(
+            cast(Sequence[float], payload["dense_vector"]),
+            [vectors[str(item.id)] for item in candidates],
+            k,
+            lambda_mult=lambda_mult,
+        )
+        selected = []
+        for index in order:
+            item = candidates[index]
+            if strip_field:
+                item = item.model_copy(
+                    update={"fields": {key: value for key, value in item.fields.items() if key != vector_field}}
+                )
+            selected.append(item)
+        merged = response.model_copy()
+        merged.result = (response.result or SearchResult()).model_copy(
+            update={"data": selected, "total_return_count": len(selected)}
+        )
+        return merged
+
+    def rerank_maxsim(
+        self,
+        response: SearchResponse,
+        query_tokens: Any,
+        *,
+        tensors: Optional[Mapping[Any, Any]] = None,
+        tensor_field: Optional[str] = None,
+        limit: Optional[int] = None,
+        partition: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> SearchResponse:
+        """Reorder a search response by client-side MaxSim against ``query_tokens``.
+
+        Candidate token tensors come from ``tensors`` (keyed by id), then from
+        ``fields[tensor_field]`` of the hits, and finally from one ``fetch`` of
+        ``tensor_field`` for the rest. Hits without a tensor keep their relative
+        order after the reranked ones. Each reranked hit's ``score`` is its MaxSim
+        score and the server score moves to ``origin_score``. Requires numpy.
+        """
+        items = list(response.result.data) if response.result else []
+        found: Dict[str, Any] = {str(key): value for key, value in (tensors or {}).items()}
+        if tensor_field is not None:
+            for item in items:
+                value = item.fields.get(tensor_field)
+                if str(item.id) not in found and value is not None:
+                    found[str(item.id)] = value
+            missing = [item.id for item in items if str(item.id) not in found]
+            if missing:
+                fetch_payload: Dict[str, Any] = {"ids": missing, "output_fields": [tensor_field]}
+                if partition is not None:
+                    fetch_payload["partition"] = partition
+                fetched = self.fetch(fetch_payload, request_options=request_options)
+                for row in fetched.result.items if fetched.result else []:
+                    value = row.fields.get(tensor_field)
+                    if value is not None:
+                        found[str(row.id)] = value
+
+        scored = [item for item in items if str(item.id) in found]
+        scores = maxsim_scores(query_tokens, [found[str(item.id)] for item in scored])
+        ranked = sorted(
+            (
+                item.model_copy(update={"score": score, "origin_score": item.score})
+                for item, score in zip(scored, scores)
+            ),
+            key=lambda item: cast(float, item.score),
+            reverse=True,
+        )
+        ranked.extend(item for item in items if str(item.id) not in found)
+        if limit is not None:
+            ranked = ranked[:limit]
+        merged = response.model_copy()
+        merged.result = (response.result or SearchResult()).model_copy(
+            update={"data": ranked, "total_return_count": len(ranked)}
+        )
+        return merged
+
+    def search_by_vector_many(
+        self,
+        queries: Sequence[Union[SearchByVectorRequest, Mapping[str, object], Sequence[float]]],
+        *,
+        template: Optional[Mapping[str, object]] = None,
+        max_concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
+        request_options: Optional[RequestOptions] = None,
+    ) -> List[Union[SearchResponse, Exception]]:
+        """Run many vector searches concurrently.
+
+        ``queries`` may mix full requests with bare vectors (including the rows of a
+        2-D NumPy array); bare vectors are merged into ``template``, which carries the
+        shared ``limit``/``filter``/``output_fields``. Identical queries are sent once,
+        results keep the order of ``queries``, and a failed query yields its exception
+        instance instead of aborting the batch. Each query consults and fills the
+        semantic cache exactly as :meth:`search_by_vector` does.
+        """
+        return self._search_many(
+            self._search_vector,
+            queries,
+            "dense_vector",
+            template,
+            max_concurrency,
+            request_options,
+        )
+
+    def search_by_multi_modal_many(
+        self,
+        queries: Sequence[Union[SearchByMultiModalRequest, Mapping[str, object], str]],
+        *,
+        template: Optional[Mapping[str, object]] = None,
+        max_concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
+        request_options: Optional[RequestOptions] = None,
+    ) -> List[Union[SearchResponse, Exception]]:
+        """Run many multi-modal searches concurrently; bare strings become ``text``."""
+        return self._search_many(
+            functools.partial(self._search, API_VECTOR_SEARCH_BY_MULTI_MODAL),
+            queries,
+            "text",
+            template,
+            max_concurrency,
+            request_options,
+        )
+
+    def search_by_id_many(
+        self,
+        queries: Sequence[Union[SearchByIDRequest, Mapping[str, object], Any]],
+        *,
+        template: Optional[Mapping[str, object]] = None,
+        max_concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
+        request_options: Optional[RequestOptions] = None,
+    ) -> List[Union[SearchResponse, Exception]]:
+        """Run many id searches concurrently; bare values become ``id``."""
+        return self._search_many(
+            functools.partial(self._search, API_VECTOR_SEARCH_BY_ID),
+            queries,
+            "id",
+            template,
+            max_concurrency,
+            request_options,
+        )
+
+    def search_by_keywords_many(
+        self,
+        queries: Sequence[Union[SearchByKeywordsRequest, Mapping[str, object], str]],
+        *,
+        template: Optional[Mapping[str, object]] = None,
+        max_concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
+        request_options: Optional[RequestOptions] = None,
+    ) -> List[Union[SearchResponse, Exception]]:
+        """Run many keyword searches concurrently; bare strings become ``query``."""
+        return self._search_many(
+            functools.partial(self._search, API_VECTOR_SEARCH_BY_KEYWORDS),
+            queries,
+            "query",
+            template,
+            max_concurrency,
+            request_options,
+        )
+
+    def _search_many(
+        self,
+        search: Callable[[Mapping[str, Any], Optional[RequestOptions]], SearchResponse],
+        queries: Sequence[Any],
+        raw_field: str,
+        template: Optional[Mapping[str, object]],
+        max_concurrency: int,
+        request_options: Optional[RequestOptions],
+    ) -> List[Union[SearchResponse, Exception]]:
+        """Fan out one search per query with at most ``max_concurrency`` in flight.
+
+        Identical payloads are sent once and their response object is shared by every
+        position that asked for it. Results keep the order of ``queries``; a failed
+        query yields its exception instance instead of aborting the batch.
+        """
+        base = self._merge_payload(self._meta_payload, template)
+        keys: List[str] = []
+        slots: Dict[str, int] = {}
+        calls = []
+        for query in queries:
+            if isinstance(query, (BaseModel, Mapping)):
+                payload = self._merge_payload(base, query)
+            else:
+                payload = self._merge_payload(base, {raw_field: _plain_query(query)})
+            key = self._payload_key(payload)
+            keys.append(key)
+            if key not in slots:
+                slots[key] = len(calls)
+                calls.append(functools.partial(search, payload, request_options))
+        results = run_concurrently(
+            calls,
+            max_concurrency=max_concurrency,
+            return_exceptions=True,
+        )
+        return [cast(Union[SearchResponse, Exception], results[slots[key]]) for key in keys]
+
+    def iter_search(
+        self,
+        kind: str,
+        request: Union[Mapping[str, object], BaseModel, None] = None,
+        *,
+        page_size: int = _DEFAULT_PAGE_SIZE,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Iterator[SearchItemResult]:
+        """Yield search hits page by page, fetching the next page in the background.
+
+        Args:
+            kind: Search flavour: ``"vector"``, ``"multi_modal"``, ``"id"``, ``"scalar"``,
+                ``"keywords"`` or ``"random"``.
+            request: Search request; its ``offset`` (if any) is used as the starting
+                position and its ``limit`` becomes the default ``max_items``. Pages are
+                requested with ``page_size`` as their limit.
+            page_size: Number of hits requested per round-trip.
+            max_items: Stop after yielding this many distinct hits; overrides the
+                request's ``limit``. Without either, the whole result set is walked.
+            prefetch: Request page ``n + 1`` as soon as page ``n`` arrives and is full.
+            request_options: Per-request overrides applied to every page.
+
+        Hits whose id already appeared on an earlier page are skipped.
+        """
+        api = _search_api(kind)
+        base, start, limit = self._page_base(request, page_size)
+        if max_items is None:
+            max_items = limit
+        seen: Set[str] = set()
+        emitted = 0
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vikingdb-prefetch") if prefetch else None
+        pending: Optional[Future] = None
+        try:
+            offset = start
+            response = self._post_page(api, base, offset, page_size, request_options)
+            while True:
+                items = response.result.data if response.result else []
+                full = len(items) >= page_size
+                offset += page_size
+                if full and executor is not None:
+                    pending = executor.submit(self._post_page, api, base, offset, page_size, request_options)
+                for item in items:
+                    key = str(item.id)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    yield item
+                    emitted += 1
+                    if max_items is not None and emitted >= max_items:
+                        return
+                if not full:
+                    return
+                if pending is not None:
+                    response, pending = pending.result(), None
+                else:
+                    response = self._post_page(api, base, offset, page_size, request_options)
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    async def async_iter_search(
+        self,
+        kind: str,
+        request: Union[Mapping[str, object], BaseModel, None] = None,
+        *,
+        page_size: int = _DEFAULT_PAGE_SIZE,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncIterator[SearchItemResult]:
+        """Asynchronous counterpart of :meth:`iter_search`."""
+        api = _search_api(kind)
+        base, start, limit = self._page_base(request, page_size)
+        if max_items is None:
+            max_items = limit
+        seen: Set[str] = set()
+        emitted = 0
+        pending: Optional["asyncio.Task[SearchResponse]"] = None
+        try:
+            offset = start
+            response = await self._async_post_page(api, base, offset, page_size, request_options)
+            while True:
+                items = response.result.data if response.result else []
+                full = len(items) >= page_size
+                offset += page_size
+                if full and prefetch:
+                    pending = asyncio.ensure_future(
+                        self._async_post_page(api, base, offset, page_size, request_options)
+                    )
+                for item in items:
+                    key = str(item.id)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    yield item
+                    emitted += 1
+                    if max_items is not None and emitted >= max_items:
+                        return
+                if not full:
+                    return
+                if pending is not None:
+                    response, pending = await pending, None
+                else:
+                    response = await self._async_post_page(api, base, offset, page_size, request_options)
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    def stream_fetch(
+        self,
+        request: Union[FetchDataInIndexRequest, Mapping[str, object]],
+        *,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Iterator[IndexDataItem]:
+        """Fetch rows and yield each one as soon as it has been read from the response.
+
+        Memory stays bounded by one row regardless of how many ids are requested.
+        Does not retry, since rows may already have been consumed when a failure
+        surfaces.
+        """
+        payload = self._merge_payload(self._meta_payload, request)
+        for row in self._service.request_items(
+            API_VECTOR_DATA_FETCH_IN_INDEX,
+            payload,
+            ("result", "fetch"),
+            options=request_options,
+        ):
+            yield IndexDataItem.model_validate(row)
+
+    def stream_search(
+        self,
+        kind: str,
+        request: Any,
+        *,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Iterator[SearchItemResult]:
+        """Run one ``search_by_<kind>`` request and yield hits while the response streams in.
+
+        Unlike :meth:`iter_search` this issues a single request; it suits searches
+        with large ``limit`` or ``output_fields`` whose full response would be costly
+        to buffer. Result and semantic caches are bypassed and nothing is retried.
+        """
+        payload = self._merge_payload(self._meta_payload, request)
+        for row in self._service.request_items(
+            _search_api(kind),
+            payload,
+            ("result", "data"),
+            options=request_options,
+        ):
+            yield SearchItemResult.model_validate(row)
+
+    def _page_base(
+        self,
+        request: Union[Mapping[str, object], BaseModel, None],
+        page_size: int,
+    ) -> Tuple[Dict[str, Any], int, Optional[int]]:
+        """Split ``request`` into the per-page payload, the start offset and its ``limit``."""
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        base = dict(self._merge_payload(self._meta_payload, request))
+        start = int(cast(int, base.pop("offset", 0) or 0))
+        limit = base.pop("limit", None)
+        return base, start, None if limit is None else int(cast(int, limit))
+
+    def _post_page(
+        self,
+        api: str,
+        base: Mapping[str, Any],
+        offset: int,
+        page_size: int,
+        request_options: Optional[RequestOptions],
+    ) -> SearchResponse:
+        payload = dict(base, limit=page_size, offset=offset)
+        return self._search(api, payload, request_options)
+
+    async def _async_post_page(
+        self,
+        api: str,
+        base: Mapping[str, Any],
+        offset: int,
+        page_size: int,
+        request_options: Optional[RequestOptions],
+    ) -> SearchResponse:
+        payload = dict(base, limit=page_size, offset=offset)
+        return cast(
+            SearchResponse,
+            await self._async_post(api, payload, SearchResponse, request_options=request_options),
+        )
@@ -21,9 +21,13 @@ __all__ = [
 
 
 class Model(BaseModel):
-    """Base model enabling alias handling and permissive parsing."""
+    """Base model enabling alias handling and permissive parsing.
 
-    model_config = ConfigDict(populate_by_name=True, alias_generator=None, extra="allow")
+    Validators are built on first use of each model (``defer_build``) rather than
+    at import time, as most processes only ever touch a handful of the APIs.
+    """
+
+    model_config = ConfigDict(populate_by_name=True, alias_generator=None, extra="allow", defer_build=True)
 
 
 class CollectionMeta(Model):
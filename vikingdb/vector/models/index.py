@@ -86,6 +86,7 @@ class SearchItemResult(Model):
     score: Optional[float] = Field(default=None, alias="score")
     origin_score: Optional[float] = Field(default=None, alias="origin_score")
     addition_score: Optional[float] = Field(default=None, alias="addition_score")
+    source_scores: Optional[Dict[str, float]] = Field(default=None, alias="source_scores")
 
 
 class SearchResult(Model):
@@ -0,0 +1,92 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Client-side post-processing of search candidates (diversification, reranking)."""
+
+from __future__ import annotations
+
+from typing import Any, List, Sequence
+
+from ._numpy import require_numpy
+
+__all__ = [
+    "maxsim_scores",
+    "mmr_select",
+]
+
+_DEFAULT_MAXSIM_BATCH = 64
+
+
+def mmr_select(
+    query: Sequence[float],
+    candidates: Any,
+    k: int,
+    *,
+    lambda_mult: float = 0.5,
+) -> List[int]:
+    """Pick ``k`` rows of ``candidates`` by maximal marginal relevance.
+
+    ``candidates`` is an ``(n, dim)`` array-like of vectors. Relevance and redundancy
+    are cosine similarities; ``lambda_mult`` trades relevance (``1.0``) against
+    diversity (``0.0``). Returns row indices in selection order.
+    """
+    np = require_numpy()
+    if not 0.0 <= lambda_mult <= 1.0:
+        raise ValueError("lambda_mult must be between 0 and 1")
+    matrix = _normalise(np, np.asarray(candidates, dtype=np.float32))
+    if matrix.ndim != 2 or k <= 0 or matrix.shape[0] == 0:
+        return []
+    relevance = matrix @ _normalise(np, np.asarray(query, dtype=np.float32).ravel())
+    similarity = matrix @ matrix.T
+    redundancy = np.full(matrix.shape[0], -np.inf, dtype=np.float32)
+    available = np.ones(matrix.shape[0], dtype=bool)
+    selected: List[int] = []
+    for _ in range(min(k, matrix.shape[0])):
+        penalty = np.where(np.isfinite(redundancy), redundancy, 0.0)
+        scores = np.where(available, lambda_mult * relevance - (1.0 - lambda_mult) * penalty, -np.inf)
+        choice = int(np.argmax(scores))
+        selected.append(choice)
+        available[choice] = False
+        redundancy = np.maximum(redundancy, similarity[:, choice])
+    return selected
+
+
+def maxsim_scores(
+    query_tokens: Any,
+    candidate_tokens: Sequence[Any],
+    *,
+    batch_size: int = _DEFAULT_MAXSIM_BATCH,
+) -> List[float]:
+    """Late-interaction (MaxSim) score of each candidate against ``query_tokens``.
+
+    ``query_tokens`` is a ``(q, dim)`` token matrix and each candidate a
+    ``(t_i, dim)`` one. A candidate's score is the sum over query tokens of the best
+    dot product with any of its tokens. Candidates are padded into batches of
+    similar length and scored with one matrix multiply per batch.
+    """
+    np = require_numpy()
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    query = np.atleast_2d(np.asarray(query_tokens, dtype=np.float32))
+    matrices = [np.atleast_2d(np.asarray(tokens, dtype=np.float32)) for tokens in candidate_tokens]
+    scores = np.zeros(len(matrices), dtype=np.float32)
+    order = sorted(range(len(matrices)), key=lambda index: matrices[index].shape[0])
+    for start in range(0, len(order), batch_size):
+        batch = order[start:start + batch_size]
+        width = max(matrices[index].shape[0] for index in batch)
+        padded = np.zeros((len(batch), width, query.shape[1]), dtype=np.float32)
+        mask = np.zeros((len(batch), width), dtype=bool)
+        for row, index in enumerate(batch):
+            tokens = matrices[index]
+            padded[row, : tokens.shape[0]] = tokens
+            mask[row, : tokens.shape[0]] = True
+        similarity = padded @ query.T  # (batch, tokens, query tokens)
+        similarity = np.where(mask[:, :, None], similarity, -np.inf)
+        best = similarity.max(axis=1)
+        scores[batch] = np.where(np.isfinite(best), best, 0.0).sum(axis=1)
+    return scores.tolist()
+
+
+def _normalise(np: Any, values: Any) -> Any:
+    norms = np.linalg.norm(values, axis=-1, keepdims=True)
+    return values / np.where(norms == 0, 1.0, norms)
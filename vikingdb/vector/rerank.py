@@ -3,12 +3,17 @@
 
 from __future__ import annotations
 
-from typing import Mapping, Optional, Union, cast
+from functools import partial
+from typing import Any, List, Mapping, Optional, Union, cast
 
+from .._concurrency import run_concurrently
 from ..request_options import RequestOptions
-from .base import VectorClientBase
+from .base import VectorClientBase, sum_token_usage
 from .client import API_VECTOR_RERANK
-from .models import RerankRequest, RerankResponse
+from .models import Rerank, RerankRequest, RerankResponse, RerankResult
+
+_DEFAULT_CHUNK_SIZE = 50
+_DEFAULT_CHUNK_CONCURRENCY = 8
 
 
 class RerankClient(VectorClientBase):
@@ -31,3 +36,50 @@ class RerankClient(VectorClientBase):
             ),
         )
         return response
+
+    def rerank_chunked(
+        self,
+        request: Union[RerankRequest, Mapping[str, object]],
+        *,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        top_k: Optional[int] = None,
+        max_concurrency: int = _DEFAULT_CHUNK_CONCURRENCY,
+        request_options: Optional[RequestOptions] = None,
+    ) -> RerankResponse:
+        """Rerank ``request.data`` in chunks of ``chunk_size`` sent concurrently.
+
+        Each ``Rerank.id`` in the result refers to the candidate's position in the
+        full ``data`` list. Results are sorted by descending score and cut to
+        ``top_k`` when given; ``token_usage`` counters are summed over the chunks.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        payload = self._merge_payload({}, request)
+        data = list(cast(List[Any], payload.get("data") or []))
+        offsets = list(range(0, len(data), chunk_size)) or [0]
+        calls = [
+            partial(
+                self.rerank,
+                dict(payload, data=data[offset:offset + chunk_size]),
+                request_options=request_options,
+            )
+            for offset in offsets
+        ]
+        responses = cast(List[RerankResponse], run_concurrently(calls, max_concurrency=max_concurrency))
+
+        ranked: List[Rerank] = []
+        for offset, response in zip(offsets, responses):
+            if response.result is None:
+                continue
+            for position, item in enumerate(response.result.data):
+                local = item.id if item.id is not None else position
+                ranked.append(item.model_copy(update={"id": offset + local}))
+        ranked.sort(key=lambda item: item.score if item.score is not None else float("-inf"), reverse=True)
+        if top_k is not None:
+            ranked = ranked[:top_k]
+        merged = responses[0].model_copy()
+        token_usage = sum_token_usage(
+            response.result.token_usage for response in responses if response.result is not None
+        )
+        merged.result = RerankResult(data=ranked, token_usage=token_usage)
+        return merged